@@ -5,10 +5,18 @@ production and prices in kg and ₹; no profit display. Dark theme with emerald
 Run with: streamlit run app.py
 """
 
+import hashlib
+import io
 import json
+import os
+import pickle
 import sys
+import threading
+import time
+import numpy as np
 import pandas as pd
 import streamlit as st
+from functools import lru_cache
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).resolve().parent
@@ -18,13 +26,27 @@ from src.config import (
     MODELS_DIR,
     METADATA_FNAME,
     INDIAN_STATES,
-    DISTRICTS_BY_STATE,
-    DEFAULT_DISTRICTS,
+    DISTRICTS_BY_STATE_TUPLES,
+    DEFAULT_DISTRICTS_TUPLE,
+    INDIAN_STATES_WITH_PLACEHOLDER,
+    STATE_PLACEHOLDER,
     FEATURE_COLUMNS,
+    MODEL_ARTIFACT_NAME,
+    BIGHA_TO_ACRES_D,
+    RAW_DATA_DIR,
+    MARKET_PRICE_FNAME,
     ensure_dirs,
 )
-from src.predictor import load_artifacts, predict_crop
-from src.market_price_fetcher import get_data_status
+from src.market_price_fetcher import fetch_and_append, get_data_status
+from src.region_data_loader import _load_price_df
+
+# Artifact paths stat'ed on every rerun, joined once
+_MODEL_PATH = MODELS_DIR / MODEL_ARTIFACT_NAME
+_META_PATH = MODELS_DIR / METADATA_FNAME
+_MARKET_PRICES_PATH = RAW_DATA_DIR / MARKET_PRICE_FNAME
+
+# src.predictor (joblib/sklearn) is imported where it is first needed, so the
+# no-model error path does not pay for loading the ML stack.
 
 
 # ---------------------------------------------------------------------------
@@ -34,54 +56,191 @@ from src.market_price_fetcher import get_data_status
 from src.zone_soil import get_default_soil_climate
 
 
-@st.cache_data
-def get_global_soil_climate():
-    """Crop-average N, P, K, etc. from dataset (used when no state selected)."""
+@st.cache_data(max_entries=64, show_spinner=False)
+def _cached_default_soil(state: str | None, district: str | None) -> dict:
+    """Per-region soil/climate defaults; pure in (state, district), so computed once each."""
+    return get_default_soil_climate(state, district)
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _get_artifacts(model_mtime: float):
+    """
+    (model, scaler, label_encoder, metadata), deserialized once per process.
+    Keyed on model.joblib mtime so a retrain is picked up without a restart;
+    max_entries=1 evicts the previous model instead of pinning one per retrain.
+    cache_resource hands out the same objects to every session — treat them as read-only.
+    """
+    from src.predictor import load_artifacts
+    return load_artifacts()
+
+
+@st.cache_resource(show_spinner=False)
+def _inference_slots() -> threading.BoundedSemaphore:
+    """
+    Process-wide cap on concurrent model scoring. Each session already runs its
+    script in its own thread; the cap keeps many sessions scoring at once from
+    oversubscribing the CPU (and each other's sklearn/BLAS threads).
+    """
+    return threading.BoundedSemaphore(max(2, os.cpu_count() or 2))
+
+
+# Top 5 strongest matches for the region
+_SCORING_MODE = "suitability"
+
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def _cached_predict(key: tuple):
+    """
+    predict_crop for one input key.
+    key = (state, district, land_size_bigha, N, P, K, temperature, humidity, ph,
+    rainfall, scoring_mode, model_mtime, prices_mtime): flat primitives, so hashing
+    it is cheap. The mtimes are only part of the key, so a retrain or a price
+    refresh yields fresh results.
+    Model scoring comes from _cached_scores, so a new land size or region only
+    reruns the economics.
+    """
+    from src.predictor import predict_crop
+    state, district, land_size_bigha, *features, scoring_mode, model_mtime, _ = key
+    return _add_display_fields(predict_crop(
+        *features,
+        land_size_bigha=land_size_bigha,
+        state=state,
+        district=district,
+        scoring_mode=scoring_mode,
+        scores=_cached_scores(tuple(features), model_mtime),
+    ))
+
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def _cached_scores(features: tuple, model_mtime: float):
+    """
+    score_crops for one (N, P, K, temperature, humidity, ph, rainfall) tuple,
+    behind the process-wide inference cap. Market-data refreshes don't touch it.
+    """
+    from src.predictor import score_crops
+    artifacts = _get_artifacts(model_mtime)
+    with _inference_slots():
+        return score_crops(*features, artifacts=artifacts)
+
+
+def _mtime_or_none(path: Path) -> float | None:
+    """One stat() that answers both "does it exist" and "which cache key"."""
     try:
-        from src.data_loader import load_crop_data
-        df = load_crop_data()
-        means = df[FEATURE_COLUMNS].mean()
-        return {k: float(means[k]) for k in FEATURE_COLUMNS}
-    except Exception:
-        return {
-            "N": 50.0, "P": 50.0, "K": 50.0,
-            "temperature": 25.0, "humidity": 65.0, "ph": 6.5, "rainfall": 120.0,
-        }
+        return path.stat().st_mtime
+    except FileNotFoundError:
+        return None
+
+
+@st.cache_data(persist="disk", show_spinner=False, max_entries=4)
+def _load_meta(mtime: float) -> dict:
+    """Parsed metadata.json; mtime is the cache key so a retrain invalidates it."""
+    with open(_META_PATH) as f:
+        return json.load(f)
 
 
-def _risk_colour(label: str) -> str:
-    return {"Low": "green", "Moderate": "orange", "High": "red", "Very High": "red"}.get(label, "grey")
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_data_status() -> dict:
+    """Sidebar price-data summary; cleared after a successful fetch."""
+    return get_data_status()
 
 
-def _confidence_text(level: str) -> str:
-    icons = {"district": "📍", "state": "🗺️", "national": "🌐", "fallback": "📊"}
-    return icons.get(level, "📊") + " " + level.upper()
+# ---------------------------------------------------------------------------
+# Static UI lookups (built once, not per rerun / per crop)
+# ---------------------------------------------------------------------------
+
+_STATE_FILTER_OPTIONS = ("All states", *INDIAN_STATES)
+_NO_STATE_DISTRICTS = ("Select state first",)
+# District choices that mean "no specific district" (state-level data)
+_NO_DISTRICT_OPTIONS = frozenset({
+    "Select state first",
+    "Other / Not Listed",
+    "Other / Not Listed (state-level data will be used)",
+})
+_DEFAULT_LAND_BIGHA = 2.0
+
+MEDALS = {1: "🥇", 2: "🥈", 3: "🥉", 4: "#4", 5: "#5"}
+_RISK_COLOURS = {"Low": "green", "Moderate": "orange", "High": "red", "Very High": "red"}
+_CONF_ICONS = {"district": "📍", "state": "🗺️", "national": "🌐", "fallback": "📊"}
+_SEVERITY_ICONS = {"high": "🔴", "medium": "🟡", "low": "🟢"}
+
+
+def _add_display_fields(result: dict) -> dict:
+    """Stamp each top-5 entry with its risk colour and data-source label, once per result."""
+    for c in result["top5"]:
+        c["risk_colour"] = _RISK_COLOURS.get(c["risk_label"], "grey")
+        level = c["data_confidence"]
+        c["confidence_label"] = _CONF_ICONS.get(level, "📊") + " " + level.upper()
+    return result
+
+
+# (report column, crop-result field) — also the layout of the hashable report key
+_REPORT_FIELDS = (
+    ("Rank", "rank"),
+    ("Crop", "crop"),
+    ("Suitability (%)", "suitability_pct"),
+    ("Estimated Production (kg)", "total_production_kg"),
+    ("Market Price (₹/kg)", "price_per_kg_inr"),
+    ("Estimated Sale Quantity (kg)", "estimated_sale_quantity_kg"),
+    ("Risk Score", "risk_score"),
+    ("Risk Level", "risk_label"),
+    ("Data Source", "data_confidence"),
+)
+
 
+# Numeric report columns; filled with np.fromiter so pandas skips dtype inference.
+_REPORT_DTYPES = {
+    "Rank": np.int8,
+    "Suitability (%)": np.float32,
+    "Estimated Production (kg)": np.float64,
+    "Market Price (₹/kg)": np.float64,
+    "Estimated Sale Quantity (kg)": np.float64,
+    "Risk Score": np.float64,
+}
 
-def build_download_df(top5: list[dict]) -> pd.DataFrame:
+
+def _top5_key(top5: list[dict]) -> tuple:
+    """Tuple-of-tuples of the report fields; cheap for st.cache_data to hash."""
+    return tuple(tuple(c[field] for _, field in _REPORT_FIELDS) for c in top5)
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _npk_shares(n: float, p: float, k: float) -> dict:
+    """Chart data for the N/P/K share bars; same soil values, same dict."""
+    total = n + p + k
+    return {
+        "Nutrient": ["Nitrogen (N)", "Phosphorus (P)", "Potassium (K)"],
+        "Share": [n / total, p / total, k / total],
+    }
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def build_download_df(top5_key: tuple) -> pd.DataFrame:
     """Advisory-only report: no profit columns."""
-    rows = []
-    for c in top5:
-        rows.append({
-            "Rank": c["rank"],
-            "Crop": c["crop"].capitalize(),
-            "Suitability (%)": c["suitability_pct"],
-            "Estimated Production (kg)": c["total_production_kg"],
-            "Market Price (₹/kg)": c["price_per_kg_inr"],
-            "Estimated Sale Quantity (kg)": c["estimated_sale_quantity_kg"],
-            "Risk Score": c["risk_score"],
-            "Risk Level": c["risk_label"],
-            "Data Source": c["data_confidence"],
-        })
-    return pd.DataFrame(rows)
+    n = len(top5_key)
+    columns = {}
+    for i, (col, _) in enumerate(_REPORT_FIELDS):
+        dtype = _REPORT_DTYPES.get(col)
+        if dtype is not None:
+            columns[col] = np.fromiter((row[i] for row in top5_key), dtype=dtype, count=n)
+        else:
+            columns[col] = [row[i] for row in top5_key]
+    columns["Crop"] = [crop.capitalize() for crop in columns["Crop"]]
+    return pd.DataFrame(columns)
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _csv_bytes(top5_key: tuple) -> bytes:
+    """UTF-8 CSV of the report, serialized once per distinct result."""
+    buf = io.BytesIO()
+    build_download_df(top5_key).to_csv(buf, index=False, encoding="utf-8")
+    return buf.getvalue()
 
 
 # ---------------------------------------------------------------------------
 # Dark + emerald theme (matches landing page)
 # ---------------------------------------------------------------------------
 
-def apply_theme():
-    st.markdown("""
+_THEME_CSS = """
     <style>
     @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;600;700;900&display=swap');
 
@@ -134,7 +293,8 @@ def apply_theme():
     }
 
     /* ── Buttons ── */
-    .stButton > button {
+    .stButton > button,
+    .stFormSubmitButton > button {
         background: #34d399 !important;
         color: #000000 !important;
         border: none !important;
@@ -145,13 +305,15 @@ def apply_theme():
         padding: 0.75rem 1.5rem !important;
         transition: all 0.2s ease;
     }
-    .stButton > button:hover {
+    .stButton > button:hover,
+    .stFormSubmitButton > button:hover {
         background: #6ee7b7 !important;
         color: #000000 !important;
         transform: translateY(-1px);
         box-shadow: 0 4px 20px rgba(52, 211, 153, 0.25);
     }
-    .stButton > button:active {
+    .stButton > button:active,
+    .stFormSubmitButton > button:active {
         transform: translateY(0);
     }
 
@@ -255,7 +417,119 @@ def apply_theme():
     ::-webkit-scrollbar-thumb { background: #1a3a2a; border-radius: 3px; }
     ::-webkit-scrollbar-thumb:hover { background: #2d5a3d; }
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+
+def apply_theme():
+    # Emitted on every run on purpose: Streamlit drops elements a rerun does not
+    # re-emit, so a once-per-session guard would strip the theme after one click.
+    st.markdown(_THEME_CSS, unsafe_allow_html=True)
+
+
+# ---------------------------------------------------------------------------
+# Last result on disk, so a reconnecting browser (new session) gets it back
+# ---------------------------------------------------------------------------
+
+_RESULTS_DIR = PROJECT_ROOT / ".cache" / "results"
+_RESULT_MAX_AGE_S = 3600
+_RESULT_MAX_FILES = 256
+_RESULT_PARAM = "result"
+
+
+def _result_id(input_key: tuple) -> str:
+    return hashlib.sha256(repr(input_key).encode()).hexdigest()[:32]
+
+
+def _save_result(result_id: str, input_key: tuple, result: dict) -> None:
+    try:
+        _RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+        with open(_RESULTS_DIR / f"{result_id}.pkl", "wb") as f:
+            pickle.dump((input_key, result), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        return  # best effort; the in-session copy is unaffected
+    _prune_results()
+
+
+def _prune_results() -> None:
+    """Delete saved results past _RESULT_MAX_AGE_S, then all but the newest _RESULT_MAX_FILES."""
+    now = time.time()
+    saved = []
+    for path in _RESULTS_DIR.glob("*.pkl"):
+        try:
+            mtime = path.stat().st_mtime
+            if now - mtime > _RESULT_MAX_AGE_S:
+                path.unlink()
+            else:
+                saved.append((mtime, path))
+        except OSError:
+            continue  # another session pruned it first
+    saved.sort(reverse=True)
+    for _, path in saved[_RESULT_MAX_FILES:]:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+@lru_cache(maxsize=32)
+def _read_result(path: Path, mtime: float) -> tuple:
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+def _load_saved_result(result_id: str) -> tuple | None:
+    """(input_key, result) saved under result_id within the last hour, else None."""
+    if len(result_id) != 32 or not all(ch in "0123456789abcdef" for ch in result_id):
+        return None  # query param is user-controlled; only our own file names
+    path = _RESULTS_DIR / f"{result_id}.pkl"
+    try:
+        mtime = path.stat().st_mtime
+        if time.time() - mtime > _RESULT_MAX_AGE_S:
+            return None
+        return _read_result(path, mtime)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+
+
+def _restore_last_result(model_mtime: float) -> None:
+    """
+    Refill session_state from the ?result= id after a websocket reconnect.
+    Only a result computed with the current model and price data is restored,
+    and the form widgets are set back to the inputs it was computed from, so
+    the view never shows a result that the inputs on screen would not produce.
+    Must run before those widgets are created.
+    """
+    if st.session_state.get("last_result") is not None:
+        return
+    result_id = st.query_params.get(_RESULT_PARAM)
+    saved = _load_saved_result(result_id) if result_id else None
+    if saved is None:
+        return
+    input_key, result = saved
+    state, district, land_size_bigha, *_, saved_model_mtime, saved_prices_mtime = input_key
+    if (saved_model_mtime, saved_prices_mtime) != (model_mtime, _mtime_or_none(_MARKET_PRICES_PATH)):
+        st.query_params.pop(_RESULT_PARAM, None)
+        return
+    if state is None:
+        district_raw = _NO_STATE_DISTRICTS[0]
+    else:
+        options = DISTRICTS_BY_STATE_TUPLES.get(state, DEFAULT_DISTRICTS_TUPLE)
+        district_raw = district if district in options else next(
+            (o for o in options if o in _NO_DISTRICT_OPTIONS), None
+        )
+    if district_raw is None:
+        st.query_params.pop(_RESULT_PARAM, None)
+        return
+    st.session_state["state_select"] = state or STATE_PLACEHOLDER
+    st.session_state["prev_state"] = state
+    st.session_state["district_select"] = district_raw
+    st.session_state["land_size_bigha"] = land_size_bigha
+    st.session_state["_last_key"], st.session_state["last_result"] = input_key, result
+
+
+def _clear_result() -> None:
+    st.session_state.pop("last_result", None)
+    st.query_params.pop(_RESULT_PARAM, None)
 
 
 # ---------------------------------------------------------------------------
@@ -274,106 +548,116 @@ def main():
     st.title("🌾 Smart Crop Advisory System")
     st.caption("Advisory recommendations • Production in kg • Prices in ₹ • Region-aware intelligence")
 
-    if not (MODELS_DIR / "model.joblib").exists():
+    model_mtime = _mtime_or_none(_MODEL_PATH)
+    if model_mtime is None:
         st.error("No trained model found. Run `python run_pipeline.py` first.")
         st.stop()
 
-    meta_path = MODELS_DIR / METADATA_FNAME
-    if meta_path.exists():
-        with open(meta_path) as f:
-            meta = json.load(f)
-        train_rows = meta.get("train_size", 0)
-        if train_rows and train_rows < 500:
-            st.warning(
-                f"**Model trained on only {train_rows} rows (sample dataset).** "
-                "Crop suitability predictions will be unreliable. "
-                "Download the **full Crop_Recommendation.csv** (2,200 rows) from Kaggle, "
-                "place it in `data/raw/`, then run `python run_pipeline.py` to retrain."
-            )
+    meta_mtime = _mtime_or_none(_META_PATH)
+    meta = _load_meta(meta_mtime) if meta_mtime is not None else {}
+    train_rows = meta.get("train_size", 0)
+    if train_rows and train_rows < 500:
+        st.warning(
+            f"**Model trained on only {train_rows} rows (sample dataset).** "
+            "Crop suitability predictions will be unreliable. "
+            "Download the **full Crop_Recommendation.csv** (2,200 rows) from Kaggle, "
+            "place it in `data/raw/`, then run `python run_pipeline.py` to retrain."
+        )
+
+    _restore_last_result(model_mtime)
+    st.session_state.setdefault("land_size_bigha", _DEFAULT_LAND_BIGHA)
 
     # -----------------------------------------------------------------------
     # HOME: State, District, Land size only
     # -----------------------------------------------------------------------
     st.header("Select region and land size")
 
-    col1, col2, col3 = st.columns(3)
+    # State sits outside the form: it drives the district options, which must
+    # refresh as soon as it changes. District + land size are batched in the
+    # form so picking them costs one rerun (on submit) instead of one per widget.
+    col1, _ = st.columns([1, 2])
 
     with col1:
         state_raw = st.selectbox(
             "State",
-            options=["— Select State —"] + INDIAN_STATES,
+            options=INDIAN_STATES_WITH_PLACEHOLDER,
             index=0,
             key="state_select",
         )
-    state = None if state_raw == "— Select State —" else state_raw
+    state = None if state_raw == STATE_PLACEHOLDER else state_raw
 
     # Reset district when state changes
     if "prev_state" not in st.session_state:
         st.session_state["prev_state"] = state
     if st.session_state["prev_state"] != state:
         st.session_state["prev_state"] = state
-        st.session_state.pop("last_result", None)
+        st.session_state.pop("district_select", None)
+        _clear_result()
 
     if state is None:
-        district_options = ["Select state first"]
+        district_options = _NO_STATE_DISTRICTS
     else:
-        district_options = DISTRICTS_BY_STATE.get(state, DEFAULT_DISTRICTS)
+        district_options = DISTRICTS_BY_STATE_TUPLES.get(state, DEFAULT_DISTRICTS_TUPLE)
 
-    with col2:
-        district_raw = st.selectbox(
-            "District",
-            options=district_options,
-            disabled=(state is None),
-        )
-    district = None
-    if district_raw and district_raw not in (
-        "Select state first",
-        "Other / Not Listed",
-        "Other / Not Listed (state-level data will be used)",
-    ):
-        district = district_raw
+    with st.form("region_form", clear_on_submit=False, border=False):
+        col2, col3 = st.columns(2)
 
-    with col3:
-        land_size_bigha = st.number_input(
-            "Land size (bigha)",
-            min_value=0.1,
-            max_value=500.0,
-            value=2.0,
-            step=0.5,
-        )
+        with col2:
+            district_raw = st.selectbox(
+                "District",
+                options=district_options,
+                disabled=(state is None),
+                key="district_select",
+            )
 
-    if state:
-        from src.region_data_loader import get_bigha_factor
-        factor = get_bigha_factor(state)
-        st.caption(f"1 bigha = {factor} acres in {state}")
+        with col3:
+            land_size_bigha = st.number_input(
+                "Land size (bigha)",
+                min_value=0.1,
+                max_value=500.0,
+                step=0.5,
+                key="land_size_bigha",  # default set in main(), restorable after reconnect
+            )
 
-    # State+district-specific soil/climate so recommendations vary by region
-    default_soil = get_default_soil_climate(state, district)
+        if state:
+            factor = BIGHA_TO_ACRES_D[state]
+            st.caption(f"1 bigha = {factor} acres in {state}")
 
-    st.divider()
+        st.divider()
 
-    proceed = st.button("✦  PROCEED TO ANALYSIS", type="primary", use_container_width=True)
+        proceed = st.form_submit_button("✦  PROCEED TO ANALYSIS", type="primary", use_container_width=True)
+
+    district = None
+    if district_raw and district_raw not in _NO_DISTRICT_OPTIONS:
+        district = district_raw
 
     # -----------------------------------------------------------------------
     # After "Proceed to Analysis": run prediction and show analysis
     # -----------------------------------------------------------------------
+    if proceed:
+        # State+district-specific soil/climate so recommendations vary by region
+        default_soil = _cached_default_soil(state, district)
+        input_key = (
+            state, district, land_size_bigha,
+            *(default_soil[k] for k in FEATURE_COLUMNS),
+            _SCORING_MODE,
+            model_mtime, _mtime_or_none(_MARKET_PRICES_PATH),
+        )
+        # Re-clicking Proceed with unchanged inputs, model and prices reuses the stored result.
+        if (
+            st.session_state.get("_last_key") == input_key
+            and st.session_state.get("last_result") is not None
+        ):
+            proceed = False
+
     if proceed:
         with st.spinner("Computing recommendations..."):
             try:
-                result = predict_crop(
-                    default_soil["N"],
-                    default_soil["P"],
-                    default_soil["K"],
-                    default_soil["temperature"],
-                    default_soil["humidity"],
-                    default_soil["ph"],
-                    default_soil["rainfall"],
-                    land_size_bigha=land_size_bigha,
-                    state=state,
-                    district=district,
-                    scoring_mode="suitability",  # top 5 strongest matches for the region
-                )
-                st.session_state["last_result"] = result
+                st.session_state["last_result"] = _cached_predict(input_key)
+                st.session_state["_last_key"] = input_key
+                result_id = _result_id(input_key)
+                _save_result(result_id, input_key, st.session_state["last_result"])
+                st.query_params[_RESULT_PARAM] = result_id
             except Exception as exc:
                 st.error(f"Prediction failed: {exc}")
                 st.stop()
@@ -381,7 +665,26 @@ def main():
     result = st.session_state.get("last_result")
     if result is None:
         st.info("Select state, district and land size, then click **Proceed to Analysis**.")
-        _render_sidebar()
+        _render_sidebar(train_rows, model_mtime)
+        return
+
+    _render_result_body(meta)
+    # Outside the fragment so the click reruns the whole app; the callback
+    # clears the result before that run, so no explicit st.rerun is needed.
+    st.button("Start new analysis", on_click=_clear_result)
+    _render_sidebar(train_rows, model_mtime)
+
+
+@st.fragment
+def _render_result_body(meta: dict):
+    """
+    Analysis view for st.session_state["last_result"]. Runs as a fragment so
+    widgets inside it (the download button) rerun only this block, not the
+    whole script with its inputs, metadata reads and sidebar. "Start new
+    analysis" is rendered by main(), outside the fragment.
+    """
+    result = st.session_state.get("last_result")
+    if result is None:
         return
 
     top5 = result["top5"]
@@ -393,7 +696,7 @@ def main():
     st.subheader("Analysis results")
     c1, c2, c3 = st.columns(3)
     c1.metric("Top recommendation", top5[0]["crop"].capitalize())
-    c2.metric("Land", f"{land_size_bigha} bigha ({result['land_size_acres']:.2f} acres)")
+    c2.metric("Land", f"{result['land_size_bigha']} bigha ({result['land_size_acres']:.2f} acres)")
     loc = region["state"]
     if region["district"] != "Not specified":
         loc += " / " + region["district"]
@@ -401,15 +704,12 @@ def main():
     st.caption("Recommendations are tailored to your land size, state, and district — crops requiring more space are excluded for small holdings.")
 
     # Soil nutrient distribution (crop-average reference) — only after analysis
-    N, P, K = default_soil["N"], default_soil["P"], default_soil["K"]
+    soil = result["soil_climate"]
+    N, P, K = soil["N"], soil["P"], soil["K"]
     total_npk = N + P + K
     if total_npk > 0:
         st.subheader("Soil nutrient distribution (crop-average reference)")
-        pie_df = pd.DataFrame({
-            "Nutrient": ["Nitrogen (N)", "Phosphorus (P)", "Potassium (K)"],
-            "Share": [N / total_npk, P / total_npk, K / total_npk],
-        }).set_index("Nutrient")
-        st.bar_chart(pie_df)
+        st.bar_chart(_npk_shares(N, P, K), x="Nutrient", y="Share")
 
     st.divider()
 
@@ -418,48 +718,54 @@ def main():
     # -----------------------------------------------------------------------
     st.subheader("Top 5 recommended crops (by suitability — strongest matches first)")
 
-    medals = {1: "🥇", 2: "🥈", 3: "🥉", 4: "#4", 5: "#5"}
-
     for c in top5:
         rank = c["rank"]
         crop = c["crop"].capitalize()
         suit = c["suitability_pct"]
         rlbl = c["risk_label"]
-        conf = c["data_confidence"]
 
-        header = f"{medals.get(rank, '#'+str(rank))}  {crop}  |  Suitability: {suit}%  |  Risk: {rlbl}"
+        header = f"{MEDALS.get(rank, '#'+str(rank))}  {crop}  |  Suitability: {suit}%  |  Risk: {rlbl}"
         with st.expander(header, expanded=(rank == 1)):
             col1, col2 = st.columns(2)
 
             with col1:
-                st.markdown("**Advisory summary**")
-                st.markdown(f"- **Estimated production:** {c['total_production_kg']:,.2f} kg")
-                st.markdown(f"- **Market price:** ₹{c['price_per_kg_inr']:,.2f} per kg")
-                st.markdown(f"- **Estimated sale quantity:** {c['estimated_sale_quantity_kg']:,.2f} kg")
-                st.markdown(f"- **Data source:** {_confidence_text(conf)}")
+                st.markdown("\n".join((
+                    "**Advisory summary**",
+                    "",
+                    f"- **Estimated production:** {c['total_production_kg']:,.2f} kg",
+                    f"- **Market price:** ₹{c['price_per_kg_inr']:,.2f} per kg",
+                    f"- **Estimated sale quantity:** {c['estimated_sale_quantity_kg']:,.2f} kg",
+                    f"- **Data source:** {c['confidence_label']}",
+                )))
 
             with col2:
-                st.markdown("**Risk assessment**")
-                st.markdown(f"Risk score: **{c['risk_score']}/100** — :{_risk_colour(rlbl)}[{rlbl}]")
+                st.markdown(
+                    "**Risk assessment**\n\n"
+                    f"Risk score: **{c['risk_score']}/100** — :{c['risk_colour']}[{rlbl}]"
+                )
                 st.progress(int(c["risk_score"]) / 100)
 
                 if c["disease_risks"]:
-                    st.markdown("**Disease / pest risks**")
-                    for d in c["disease_risks"]:
-                        icon = {"high": "🔴", "medium": "🟡", "low": "🟢"}.get(d["severity"], "⚪")
-                        st.markdown(
-                            f"{icon} **{d['name']}** — *{d['severity']}* | ~{int(d['probability']*100)}% | {d['season']}"
-                        )
+                    st.markdown("\n\n".join((
+                        "**Disease / pest risks**",
+                        *(
+                            f"{_SEVERITY_ICONS.get(d['severity'], '⚪')} **{d['name']}** — "
+                            f"*{d['severity']}* | ~{int(d['probability']*100)}% | {d['season']}"
+                            for d in c["disease_risks"]
+                        ),
+                    )))
 
             if c["prevention_measures"]:
-                st.markdown("**Prevention & management**")
-                for m in c["prevention_measures"]:
-                    st.markdown(f"- {m}")
+                st.markdown(
+                    "**Prevention & management**\n\n"
+                    + "\n".join(f"- {m}" for m in c["prevention_measures"])
+                )
 
             if c["crop_suggestions"]:
-                st.markdown("**Soil-based growing tips**")
-                for s in c["crop_suggestions"]:
-                    st.markdown(f"- {s}")
+                st.markdown(
+                    "**Soil-based growing tips**\n\n"
+                    + "\n".join(f"- {s}" for s in c["crop_suggestions"])
+                )
 
     st.divider()
 
@@ -470,9 +776,7 @@ def main():
 
     with st.expander("Why these crops? (ML explanation)"):
         st.info(result["explanation"])
-        if meta_path.exists():
-            with open(meta_path) as f:
-                meta = json.load(f)
+        if meta:
             st.caption(
                 f"Model: {meta.get('best_model_name', 'N/A')} | "
                 f"Test F1: {meta.get('test_f1_macro', 'N/A')} | "
@@ -481,12 +785,12 @@ def main():
 
     st.divider()
     st.subheader("Download report")
-    report_df = build_download_df(top5)
+    report_key = _top5_key(top5)
     loc_tag = (region["state"] or "NoRegion").replace(" ", "_")
-    st.dataframe(report_df, use_container_width=True)
+    st.dataframe(build_download_df(report_key), use_container_width=True)
     st.download_button(
         label="Download CSV",
-        data=report_df.to_csv(index=False).encode("utf-8"),
+        data=_csv_bytes(report_key),  # cached: serialized once per distinct result
         file_name=f"advisory_{loc_tag}.csv",
         mime="text/csv",
     )
@@ -497,71 +801,80 @@ def main():
             "For district-level accuracy, add state_wise_yield.csv and cost_of_cultivation.csv in data/raw/."
         )
 
-    # New analysis
-    if st.button("Start new analysis"):
-        st.session_state.pop("last_result", None)
-        st.rerun()
 
-    _render_sidebar()
+@st.cache_data(show_spinner=False, max_entries=4)
+def _num_crops(model_mtime: float) -> int:
+    """Number of classes the model predicts; only touches the model when it changes."""
+    _, _, label_encoder, _ = _get_artifacts(model_mtime)
+    return len(label_encoder.classes_) if label_encoder else 0
 
 
-def _get_engine_stats():
-    """ML model stats + market data stats."""
+@st.cache_data(ttl=300, show_spinner=False)
+def _get_engine_stats(train_size: int, model_mtime: float):
+    """ML model stats + market data stats. train_size and model_mtime come from main()'s single read/stat."""
     try:
-        meta_path = MODELS_DIR / METADATA_FNAME
-        if meta_path.exists():
-            with open(meta_path) as f:
-                meta = json.load(f)
-            train_size = meta.get("train_size", 0)
-        else:
-            train_size = 0
-        model, _, label_encoder, _ = load_artifacts()
-        num_crops = len(label_encoder.classes_) if label_encoder else 0
+        num_crops = _num_crops(model_mtime)
     except Exception:
-        train_size = 0
         num_crops = "?"
 
-    status = get_data_status()
+    status = _cached_data_status()
     num_states = status.get("states", "—") if status.get("exists") else "—"
 
     return {"records": train_size, "states": num_states, "crops": num_crops}
 
 
-def _render_sidebar():
-    sb = st.sidebar
-    sb.markdown(
+@st.fragment
+def _api_refresh_fragment():
+    """data.gov.in price refresh; a fragment so typing the key or clicking Fetch
+    does not rerun the whole app."""
+    st.write("Paste your data.gov.in API key (register at data.gov.in → My Account)")
+    api_key_input = st.text_input("API Key", type="password")
+    state_filter = st.selectbox("Filter by state", _STATE_FILTER_OPTIONS)
+    if st.button("Fetch prices"):
+        if not api_key_input:
+            st.error("Enter an API key first.")
+        else:
+            sf = None if state_filter == "All states" else state_filter
+            with st.spinner("Fetching..."):
+                try:
+                    added = fetch_and_append(api_key=api_key_input, state_filter=sf)
+                    if added:
+                        _load_price_df.cache_clear()   # other datasets stay cached
+                        _cached_data_status.clear()
+                        _get_engine_stats.clear()
+                        _cached_predict.clear()
+                        st.session_state.pop("_last_key", None)
+                        st.success(f"Added {added:,} rows. Run analysis again to use new prices.")
+                    else:
+                        st.info("No new price records since the last fetch.")
+                except Exception as exc:
+                    st.error(f"Failed: {exc}")
+
+
+def _render_sidebar(train_size: int, model_mtime: float):
+    with st.sidebar:
+        _sidebar_fragment(train_size, model_mtime)
+
+
+@st.fragment
+def _sidebar_fragment(train_size: int, model_mtime: float):
+    """Sidebar body; a fragment so its widgets rerun only the sidebar, not the result view."""
+    st.markdown(
         '<div style="text-align:center; padding: 0.5rem 0 1rem;">'
         '<span style="color:#34d399; font-weight:900; font-size:1.1rem; letter-spacing:0.1em;">SMART CROP</span>'
         '</div>',
         unsafe_allow_html=True,
     )
-    sb.divider()
-    sb.markdown("**Data used for analysis**")
-    stats = _get_engine_stats()
-    sb.caption(f"**Total records:** {stats['records']:,}" if isinstance(stats["records"], int) else f"**Total records:** {stats['records']}")
-    sb.caption(f"**States:** {stats['states']}")
-    sb.caption(f"**Total crops:** {stats['crops']}")
-    with sb.expander("Refresh via data.gov.in API"):
-        st.write("Paste your data.gov.in API key (register at data.gov.in → My Account)")
-        api_key_input = st.text_input("API Key", type="password")
-        state_filter = st.selectbox("Filter by state", ["All states"] + INDIAN_STATES)
-        if st.button("Fetch prices"):
-            if not api_key_input:
-                st.error("Enter an API key first.")
-            else:
-                sf = None if state_filter == "All states" else state_filter
-                with st.spinner("Fetching..."):
-                    try:
-                        from src.market_price_fetcher import fetch_and_save
-                        from src.region_data_loader import _datasets
-                        fetch_and_save(api_key=api_key_input, state_filter=sf)
-                        _datasets.cache_clear()
-                        st.success("Updated. Run analysis again to use new prices.")
-                    except Exception as exc:
-                        st.error(f"Failed: {exc}")
-    sb.divider()
-    sb.caption("Smart Crop Advisory System")
-
+    st.divider()
+    st.markdown("**Data used for analysis**")
+    stats = _get_engine_stats(train_size, model_mtime)
+    st.caption(f"**Total records:** {stats['records']:,}" if isinstance(stats["records"], int) else f"**Total records:** {stats['records']}")
+    st.caption(f"**States:** {stats['states']}")
+    st.caption(f"**Total crops:** {stats['crops']}")
+    with st.expander("Refresh via data.gov.in API"):
+        _api_refresh_fragment()
+    st.divider()
+    st.caption("Smart Crop Advisory System")
 
 if __name__ == "__main__":
     main()
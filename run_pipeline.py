@@ -6,11 +6,13 @@ Run from project root: python run_pipeline.py
 import sys
 from pathlib import Path
 
+from sklearn import set_config
+
 # Ensure project root is on path
 PROJECT_ROOT = Path(__file__).resolve().parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from src.config import ensure_dirs, FIGURES_DIR
+from src.config import ensure_dirs, FIGURES_DIR, RANDOM_STATE
 from src.data_loader import load_crop_data, get_all_crop_data_paths
 from src.crop_params import generate_all_new_crops, CROP_PARAMS
 from src.eda import run_full_eda
@@ -18,9 +20,10 @@ from src.preprocess import preprocess_pipeline
 from src.train import train_and_select_best, save_artifacts
 from src.evaluate import plot_learning_curve
 
-
 def main():
     ensure_dirs()
+    # Inputs are dropna()'d on load, so skip sklearn's per-call NaN/inf checks.
+    set_config(assume_finite=True)
     print("Smart Crop Recommendation — Full pipeline")
     print("=" * 50)
 
@@ -45,13 +48,13 @@ def main():
         print(f"\nGenerating {len(new_crops_in_db)} additional crops ({base_per_crop} samples each):")
         print(f"  {sorted(new_crops_in_db)}")
         import pandas as pd
-        from src.crop_params import generate_crop_samples
+        from src.crop_params import generate_samples_for_crops, make_rng
         import numpy as np
-        rng = np.random.default_rng(42)
-        new_frames = []
-        for crop in sorted(new_crops_in_db):
-            new_frames.append(generate_crop_samples(crop, base_per_crop, rng=rng))
-        new_df = pd.concat(new_frames, ignore_index=True)
+        # One independent, deterministic stream per crop (spawned from a common
+        # seed), so a crop's samples do not depend on which other crops are drawn.
+        crops = sorted(new_crops_in_db)
+        seeds = np.random.SeedSequence(RANDOM_STATE).spawn(len(crops))
+        new_df = generate_samples_for_crops(crops, base_per_crop, [make_rng(s) for s in seeds])
         df = pd.concat([df, new_df], ignore_index=True)
         print(f"  Expanded dataset: {len(df)} samples, {df['label'].nunique()} crops")
     else:
@@ -0,0 +1,75 @@
+"""
+Large lookup tables behind src.config, imported on first use.
+
+src.config re-exports these names through a module-level __getattr__, so
+`from src.config import DISTRICTS_BY_STATE` still works; pipeline runs that
+never touch the zone or district tables don't build them.
+"""
+
+import json
+import sys
+from collections.abc import Mapping
+from types import MappingProxyType
+
+import numpy as np
+
+from src.config import DISTRICTS_FNAME, FEATURE_COLUMNS, STATIC_DATA_DIR, _DEFAULT_SOIL_CLIMATE
+
+# ---------------------------------------------------------------------------
+# Agro-climatic zone defaults (state → N,P,K,temp,humidity,ph,rainfall)
+# Used by app for region-specific inputs and by data_loader when converting crop_yield.csv.
+# ---------------------------------------------------------------------------
+_ZONE_DEFAULTS_RAW: dict[str, dict[str, float]] = {
+    "arid_nw":       {"N": 20, "P": 28, "K": 32, "temperature": 32.0, "humidity": 44.0, "ph": 7.6, "rainfall": 28.0},
+    "eastern_humid": {"N": 85, "P": 42, "K": 38, "temperature": 21.0, "humidity": 90.0, "ph": 5.7, "rainfall": 295.0},
+    "southern":      {"N": 72, "P": 48, "K": 45, "temperature": 24.0, "humidity": 80.0, "ph": 6.2, "rainfall": 195.0},
+    "west_coast":    {"N": 84, "P": 40, "K": 36, "temperature": 20.2, "humidity": 91.0, "ph": 5.6, "rainfall": 285.0},
+    "central":       {"N": 52, "P": 44, "K": 41, "temperature": 25.5, "humidity": 70.0, "ph": 6.1, "rainfall": 92.0},
+    "himalayan":     {"N": 87, "P": 42, "K": 40, "temperature": 18.5, "humidity": 87.0, "ph": 5.9, "rainfall": 255.0},
+    "western_dry":   {"N": 40, "P": 36, "K": 40, "temperature": 27.0, "humidity": 59.0, "ph": 6.9, "rainfall": 55.0},
+}
+# Read-only views, shared by every reader
+ZONE_DEFAULTS: dict[str, Mapping[str, float]] = {k: MappingProxyType(v) for k, v in _ZONE_DEFAULTS_RAW.items()}
+STATE_ZONE: dict[str, str] = {
+    "Rajasthan": "arid_nw", "Haryana": "arid_nw", "Punjab": "arid_nw", "Delhi": "arid_nw", "Chandigarh": "arid_nw",
+    "West Bengal": "eastern_humid", "Odisha": "eastern_humid", "Assam": "eastern_humid",
+    "Arunachal Pradesh": "eastern_humid", "Manipur": "eastern_humid", "Meghalaya": "eastern_humid",
+    "Mizoram": "eastern_humid", "Nagaland": "eastern_humid", "Tripura": "eastern_humid",
+    "Andhra Pradesh": "southern", "Telangana": "southern", "Karnataka": "southern", "Tamil Nadu": "southern", "Puducherry": "southern",
+    "Kerala": "west_coast", "Goa": "west_coast",
+    "Maharashtra": "western_dry", "Gujarat": "western_dry", "Dadra and Nagar Haveli and Daman and Diu": "western_dry",
+    "Madhya Pradesh": "central", "Chhattisgarh": "central", "Uttar Pradesh": "central", "Bihar": "central", "Jharkhand": "central",
+    "Himachal Pradesh": "himalayan", "Uttarakhand": "himalayan", "Jammu and Kashmir": "himalayan", "Ladakh": "himalayan", "Sikkim": "himalayan",
+    "Andaman and Nicobar Islands": "eastern_humid", "Lakshadweep": "west_coast",
+}
+STATE_ZONE = {sys.intern(k): v for k, v in STATE_ZONE.items()}
+
+# Column-wise form for vectorized fills: ZONE_MATRIX[STATE_ZONE_ROW.get(state, FALLBACK_ZONE_ROW)]
+# is that state's soil/climate in FEATURE_COLUMNS order; the last row is the no-zone default.
+ZONE_ORDER: tuple[str, ...] = tuple(ZONE_DEFAULTS)
+ZONE_MATRIX: np.ndarray = np.array(
+    [[ZONE_DEFAULTS[z][c] for c in FEATURE_COLUMNS] for z in ZONE_ORDER]
+    + [[_DEFAULT_SOIL_CLIMATE[c] for c in FEATURE_COLUMNS]],
+    dtype=np.float64,
+)
+ZONE_MATRIX.flags.writeable = False
+FALLBACK_ZONE_ROW = len(ZONE_ORDER)
+STATE_ZONE_ROW: dict[str, int] = {s: ZONE_ORDER.index(z) for s, z in STATE_ZONE.items()}
+
+# ---------------------------------------------------------------------------
+# Key agricultural districts by state
+# (major crop-producing districts listed; less common → "Other / Not Listed")
+# All states/UTs in INDIAN_STATES have an entry so district dropdown always shows options.
+# The table lives in data/static/districts_by_state.json: a C-level json parse
+# is cheaper than compiling and executing it as a Python literal.
+# ---------------------------------------------------------------------------
+def _read_districts() -> dict[str, list[str]]:
+    """State -> district list from the static JSON (called once, below)."""
+    with open(STATIC_DATA_DIR / DISTRICTS_FNAME, encoding="utf-8") as f:
+        return {sys.intern(k): v for k, v in json.load(f).items()}
+
+
+DISTRICTS_BY_STATE: dict[str, list[str]] = _read_districts()
+
+# Immutable district options for the app's selectbox
+DISTRICTS_BY_STATE_TUPLES: dict[str, tuple[str, ...]] = {k: tuple(v) for k, v in DISTRICTS_BY_STATE.items()}
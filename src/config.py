@@ -3,7 +3,13 @@ Configuration and constants for the Smart Crop Recommendation System.
 Centralizes paths, column names, random seed, regional data, and scoring weights.
 """
 
+import os
+import sys
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 
 # ---------------------------------------------------------------------------
 # Base paths (project root = parent of 'src')
@@ -12,6 +18,7 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent
 DATA_DIR = PROJECT_ROOT / "data"
 RAW_DATA_DIR = DATA_DIR / "raw"
 PROCESSED_DATA_DIR = DATA_DIR / "processed"
+STATIC_DATA_DIR = DATA_DIR / "static"   # versioned lookup tables (not user data)
 MODELS_DIR = PROJECT_ROOT / "models"
 REPORTS_DIR = PROJECT_ROOT / "reports"
 FIGURES_DIR = REPORTS_DIR / "figures"
@@ -36,16 +43,21 @@ SAMPLE_DATA_FNAME = "Crop_Recommendation_sample.csv"
 REGION_YIELD_FNAME       = "state_wise_yield.csv"
 CROP_YIELD_FNAME         = "crop_yield.csv"   # optional: converted to training rows (Crop, Annual_Rainfall, State -> N,P,K,...)
 MARKET_PRICE_FNAME       = "market_prices.csv"
+MARKET_PRICE_WATERMARK_FNAME = "market_prices_watermark.json"  # last arrival_date fetched, per state filter
 COST_CULTIVATION_FNAME   = "cost_of_cultivation.csv"
 CLIMATE_RISK_FNAME       = "climate_vulnerability.csv"
 UNIFIED_REGION_FNAME     = "unified_crop_region_data.csv"   # cached merged table
+DISTRICTS_FNAME          = "districts_by_state.json"        # in STATIC_DATA_DIR
 
 # ---------------------------------------------------------------------------
 # Feature and target column names (must match dataset)
 # ---------------------------------------------------------------------------
-FEATURE_COLUMNS = ["N", "P", "K", "temperature", "humidity", "ph", "rainfall"]
+# Tuples are immutable; index DataFrames with list(FEATURE_COLUMNS) (a tuple is read as one key).
+FEATURE_COLUMNS: tuple[str, ...] = ("N", "P", "K", "temperature", "humidity", "ph", "rainfall")
+FEATURE_COLUMN_SET = frozenset(FEATURE_COLUMNS)   # for membership tests
 TARGET_COLUMN   = "label"
-TARGET_ALIASES  = ("label", "crop", "Crop")
+TARGET_ALIASES  = ("label", "crop", "Crop")       # in priority order
+TARGET_ALIAS_SET = frozenset(TARGET_ALIASES)
 
 # ---------------------------------------------------------------------------
 # ML constants
@@ -83,6 +95,13 @@ CROP_MIN_LAND_ACRES: dict[str, float] = {
     "linseed": 0.1, "guar seed": 0.1, "horse-gram": 0.1, "khesari": 0.1,
     "sannhamp": 0.1,
 }
+CROP_MIN_LAND_ACRES = {sys.intern(k): v for k, v in CROP_MIN_LAND_ACRES.items()}
+
+
+@lru_cache(maxsize=256)
+def min_land_for(crop: str) -> float:
+    """Minimum viable acres for a crop name (any case/whitespace); memoized per raw name."""
+    return CROP_MIN_LAND_ACRES.get(crop.strip().lower(), DEFAULT_MIN_LAND_ACRES)
 
 # ---------------------------------------------------------------------------
 # Model artifact names
@@ -106,6 +125,27 @@ W_RISK        = 0.20
 YIELD_BASE_FACTOR = 0.60
 YIELD_CONF_FACTOR = 0.40
 
+
+@dataclass(frozen=True, slots=True)
+class ScoringCfg:
+    """The scoring globals above as one immutable object, for per-candidate hot paths."""
+    mode: str
+    w_suitability: float
+    w_profit: float
+    w_risk: float
+    yield_base: float
+    yield_conf: float
+
+
+SCORING = ScoringCfg(
+    mode=SCORING_MODE,
+    w_suitability=W_SUITABILITY,
+    w_profit=W_PROFIT,
+    w_risk=W_RISK,
+    yield_base=YIELD_BASE_FACTOR,
+    yield_conf=YIELD_CONF_FACTOR,
+)
+
 # ---------------------------------------------------------------------------
 # Bigha → acres conversion (state-specific, gazetted references, approx.)
 # ---------------------------------------------------------------------------
@@ -149,213 +189,111 @@ BIGHA_TO_ACRES: dict[str, float] = {
 }
 DEFAULT_BIGHA_ACRES = 0.40   # fallback when state not in map
 
+# Interned keys: region names parsed from CSVs are interned too (data_loader), so
+# dict probes against them can match on identity before comparing characters.
+BIGHA_TO_ACRES = {sys.intern(k): v for k, v in BIGHA_TO_ACRES.items()}
+
+
+class _BighaTable(dict):
+    """BIGHA_TO_ACRES that answers DEFAULT_BIGHA_ACRES for unknown states (without storing them)."""
+
+    def __missing__(self, state):
+        return DEFAULT_BIGHA_ACRES
+
+
+# Single-lookup form: BIGHA_TO_ACRES_D[state] also works for None; pandas .map() honours it too
+BIGHA_TO_ACRES_D: dict[str, float] = _BighaTable(BIGHA_TO_ACRES)
+
 # ---------------------------------------------------------------------------
 # Indian states list (for UI dropdown)
+# Pre-sorted keys of BIGHA_TO_ACRES; tests/test_config.py checks they stay in sync.
 # ---------------------------------------------------------------------------
-INDIAN_STATES: list[str] = sorted(BIGHA_TO_ACRES.keys())
+INDIAN_STATES: tuple[str, ...] = (
+    "Andaman and Nicobar Islands",
+    "Andhra Pradesh",
+    "Arunachal Pradesh",
+    "Assam",
+    "Bihar",
+    "Chandigarh",
+    "Chhattisgarh",
+    "Dadra and Nagar Haveli and Daman and Diu",
+    "Delhi",
+    "Goa",
+    "Gujarat",
+    "Haryana",
+    "Himachal Pradesh",
+    "Jammu and Kashmir",
+    "Jharkhand",
+    "Karnataka",
+    "Kerala",
+    "Ladakh",
+    "Lakshadweep",
+    "Madhya Pradesh",
+    "Maharashtra",
+    "Manipur",
+    "Meghalaya",
+    "Mizoram",
+    "Nagaland",
+    "Odisha",
+    "Puducherry",
+    "Punjab",
+    "Rajasthan",
+    "Sikkim",
+    "Tamil Nadu",
+    "Telangana",
+    "Tripura",
+    "Uttar Pradesh",
+    "Uttarakhand",
+    "West Bengal",
+)
 
 # ---------------------------------------------------------------------------
-# Agro-climatic zone defaults (state → N,P,K,temp,humidity,ph,rainfall)
-# Used by app for region-specific inputs and by data_loader when converting crop_yield.csv.
+# Agro-climatic zones and district lists live in src/_config_tables.py and are
+# loaded on first access (see __getattr__ below).
 # ---------------------------------------------------------------------------
-ZONE_DEFAULTS: dict[str, dict[str, float]] = {
-    "arid_nw":       {"N": 20, "P": 28, "K": 32, "temperature": 32.0, "humidity": 44.0, "ph": 7.6, "rainfall": 28.0},
-    "eastern_humid": {"N": 85, "P": 42, "K": 38, "temperature": 21.0, "humidity": 90.0, "ph": 5.7, "rainfall": 295.0},
-    "southern":      {"N": 72, "P": 48, "K": 45, "temperature": 24.0, "humidity": 80.0, "ph": 6.2, "rainfall": 195.0},
-    "west_coast":    {"N": 84, "P": 40, "K": 36, "temperature": 20.2, "humidity": 91.0, "ph": 5.6, "rainfall": 285.0},
-    "central":       {"N": 52, "P": 44, "K": 41, "temperature": 25.5, "humidity": 70.0, "ph": 6.1, "rainfall": 92.0},
-    "himalayan":     {"N": 87, "P": 42, "K": 40, "temperature": 18.5, "humidity": 87.0, "ph": 5.9, "rainfall": 255.0},
-    "western_dry":   {"N": 40, "P": 36, "K": 40, "temperature": 27.0, "humidity": 59.0, "ph": 6.9, "rainfall": 55.0},
-}
-STATE_ZONE: dict[str, str] = {
-    "Rajasthan": "arid_nw", "Haryana": "arid_nw", "Punjab": "arid_nw", "Delhi": "arid_nw", "Chandigarh": "arid_nw",
-    "West Bengal": "eastern_humid", "Odisha": "eastern_humid", "Assam": "eastern_humid",
-    "Arunachal Pradesh": "eastern_humid", "Manipur": "eastern_humid", "Meghalaya": "eastern_humid",
-    "Mizoram": "eastern_humid", "Nagaland": "eastern_humid", "Tripura": "eastern_humid",
-    "Andhra Pradesh": "southern", "Telangana": "southern", "Karnataka": "southern", "Tamil Nadu": "southern", "Puducherry": "southern",
-    "Kerala": "west_coast", "Goa": "west_coast",
-    "Maharashtra": "western_dry", "Gujarat": "western_dry", "Dadra and Nagar Haveli and Daman and Diu": "western_dry",
-    "Madhya Pradesh": "central", "Chhattisgarh": "central", "Uttar Pradesh": "central", "Bihar": "central", "Jharkhand": "central",
-    "Himachal Pradesh": "himalayan", "Uttarakhand": "himalayan", "Jammu and Kashmir": "himalayan", "Ladakh": "himalayan", "Sikkim": "himalayan",
-    "Andaman and Nicobar Islands": "eastern_humid", "Lakshadweep": "west_coast",
-}
+_LAZY_TABLES = frozenset({
+    "ZONE_DEFAULTS", "STATE_ZONE",
+    "ZONE_ORDER", "ZONE_MATRIX", "FALLBACK_ZONE_ROW", "STATE_ZONE_ROW",
+    "DISTRICTS_BY_STATE", "DISTRICTS_BY_STATE_TUPLES",
+})
 
 
-def get_state_soil_climate(state: str | None) -> dict[str, float]:
-    """Return N,P,K,temperature,humidity,ph,rainfall for a state (from agro-climatic zone). Used for crop_yield conversion."""
-    if not state or state not in STATE_ZONE:
-        return {k: 50.0 if k in ("N", "P", "K") else 25.0 if k == "temperature" else 65.0 if k == "humidity" else 6.5 if k == "ph" else 120.0 for k in FEATURE_COLUMNS}
-    zone = STATE_ZONE[state]
-    return dict(ZONE_DEFAULTS[zone])
+def __getattr__(name: str):
+    """PEP 562 hook: import the large tables only when one of them is first referenced."""
+    if name in _LAZY_TABLES:
+        from src import _config_tables
+        value = getattr(_config_tables, name)
+        globals()[name] = value   # later lookups skip this hook
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Soil/climate for states with no agro-climatic zone (read-only, shared)
+_DEFAULT_SOIL_CLIMATE: Mapping[str, float] = MappingProxyType({
+    "N": 50.0, "P": 50.0, "K": 50.0, "temperature": 25.0, "humidity": 65.0, "ph": 6.5, "rainfall": 120.0,
+})
+
 
-# ---------------------------------------------------------------------------
-# Key agricultural districts by state
-# (major crop-producing districts listed; less common → "Other / Not Listed")
-# All states/UTs in INDIAN_STATES have an entry so district dropdown always shows options.
-# ---------------------------------------------------------------------------
-DISTRICTS_BY_STATE: dict[str, list[str]] = {
-    "Andaman and Nicobar Islands": [
-        "South Andaman", "North and Middle Andaman", "Nicobar", "Other / Not Listed",
-    ],
-    "Andhra Pradesh": [
-        "Guntur", "Krishna", "Kurnool", "East Godavari", "West Godavari",
-        "Prakasam", "Srikakulam", "Vizianagaram", "Visakhapatnam",
-        "Nellore", "Chittoor", "Kadapa", "Anantapur", "Other / Not Listed",
-    ],
-    "Arunachal Pradesh": [
-        "Papum Pare", "Changlang", "Lohit", "West Kameng", "East Siang",
-        "Lower Subansiri", "Tirap", "Tawang", "Upper Siang", "Other / Not Listed",
-    ],
-    "Assam": [
-        "Kamrup", "Nagaon", "Barpeta", "Goalpara", "Sibsagar", "Darrang",
-        "Dibrugarh", "Cachar", "Tinsukia", "Jorhat", "Sonitpur", "Other / Not Listed",
-    ],
-    "Bihar": [
-        "Patna", "Muzaffarpur", "Gaya", "Bhagalpur", "Nalanda", "Vaishali",
-        "Saran", "Siwan", "East Champaran", "West Champaran", "Rohtas",
-        "Aurangabad", "Darbhanga", "Samastipur", "Other / Not Listed",
-    ],
-    "Chandigarh": [
-        "Chandigarh", "Other / Not Listed",
-    ],
-    "Chhattisgarh": [
-        "Raipur", "Bilaspur", "Durg", "Rajnandgaon", "Raigarh",
-        "Korba", "Janjgir-Champa", "Bastar", "Surguja", "Other / Not Listed",
-    ],
-    "Dadra and Nagar Haveli and Daman and Diu": [
-        "Dadra and Nagar Haveli", "Daman", "Diu", "Other / Not Listed",
-    ],
-    "Delhi": [
-        "North Delhi", "South Delhi", "East Delhi", "West Delhi", "Central Delhi",
-        "New Delhi", "North East Delhi", "North West Delhi", "Shahdara", "Other / Not Listed",
-    ],
-    "Goa": [
-        "North Goa", "South Goa", "Other / Not Listed",
-    ],
-    "Gujarat": [
-        "Ahmedabad", "Anand", "Mehsana", "Kheda", "Junagadh", "Rajkot",
-        "Amreli", "Surat", "Vadodara", "Bharuch", "Banaskantha",
-        "Patan", "Sabarkantha", "Other / Not Listed",
-    ],
-    "Haryana": [
-        "Karnal", "Hisar", "Sirsa", "Fatehabad", "Rohtak", "Bhiwani",
-        "Jind", "Sonipat", "Ambala", "Kurukshetra", "Yamunanagar",
-        "Kaithal", "Panipat", "Other / Not Listed",
-    ],
-    "Himachal Pradesh": [
-        "Shimla", "Kangra", "Mandi", "Kullu", "Solan", "Sirmaur",
-        "Una", "Hamirpur", "Bilaspur", "Chamba", "Other / Not Listed",
-    ],
-    "Jharkhand": [
-        "Ranchi", "Dhanbad", "Hazaribagh", "Bokaro", "Giridih",
-        "East Singhbhum", "West Singhbhum", "Gumla", "Other / Not Listed",
-    ],
-    "Karnataka": [
-        "Belagavi", "Tumkur", "Mysuru", "Dharwad", "Haveri", "Davangere",
-        "Shivamogga", "Mandya", "Hassan", "Raichur", "Ballari",
-        "Kalaburagi", "Vijayapura", "Bengaluru Rural", "Kodagu", "Other / Not Listed",
-    ],
-    "Kerala": [
-        "Thrissur", "Malappuram", "Palakkad", "Kozhikode", "Wayanad",
-        "Kannur", "Ernakulam", "Alappuzha", "Kottayam", "Idukki",
-        "Thiruvananthapuram", "Other / Not Listed",
-    ],
-    "Madhya Pradesh": [
-        "Indore", "Bhopal", "Ujjain", "Sagar", "Hoshangabad", "Chhindwara",
-        "Vidisha", "Raisen", "Rewa", "Sehore", "Dewas", "Mandsaur",
-        "Neemuch", "Gwalior", "Morena", "Shivpuri", "Other / Not Listed",
-    ],
-    "Maharashtra": [
-        "Pune", "Nashik", "Aurangabad", "Solapur", "Kolhapur", "Sangli",
-        "Ahmednagar", "Satara", "Jalgaon", "Nanded", "Amravati", "Nagpur",
-        "Akola", "Latur", "Osmanabad", "Other / Not Listed",
-    ],
-    "Odisha": [
-        "Cuttack", "Puri", "Ganjam", "Kalahandi", "Bargarh", "Mayurbhanj",
-        "Kendrapara", "Balasore", "Sambalpur", "Koraput", "Sundargarh",
-        "Other / Not Listed",
-    ],
-    "Punjab": [
-        "Ludhiana", "Amritsar", "Jalandhar", "Patiala", "Bathinda",
-        "Moga", "Ferozepur", "Faridkot", "Gurdaspur", "Sangrur",
-        "Hoshiarpur", "Rupnagar", "Other / Not Listed",
-    ],
-    "Rajasthan": [
-        "Jaipur", "Jodhpur", "Sikar", "Sri Ganganagar", "Hanumangarh",
-        "Churu", "Bikaner", "Alwar", "Bharatpur", "Kota", "Bundi",
-        "Tonk", "Nagaur", "Barmer", "Pali", "Ajmer", "Other / Not Listed",
-    ],
-    "Tamil Nadu": [
-        "Coimbatore", "Thanjavur", "Erode", "Salem", "Tirupur", "Madurai",
-        "Tirunelveli", "Villupuram", "Dharmapuri", "Vellore", "Thiruvarur",
-        "Nagapattinam", "Dindigul", "Tiruchirapalli", "Other / Not Listed",
-    ],
-    "Telangana": [
-        "Warangal", "Khammam", "Nizamabad", "Karimnagar", "Medak",
-        "Nalgonda", "Mahbubnagar", "Rangareddy", "Adilabad", "Suryapet",
-        "Jagtial", "Other / Not Listed",
-    ],
-    "Uttar Pradesh": [
-        "Lucknow", "Agra", "Varanasi", "Kanpur", "Prayagraj", "Meerut",
-        "Moradabad", "Muzaffarnagar", "Bareilly", "Mathura", "Aligarh",
-        "Gorakhpur", "Sitapur", "Barabanki", "Hardoi", "Shahjahanpur",
-        "Bahraich", "Gonda", "Lakhimpur Kheri", "Other / Not Listed",
-    ],
-    "Uttarakhand": [
-        "Dehradun", "Haridwar", "Udham Singh Nagar", "Nainital",
-        "Pauri Garhwal", "Tehri Garhwal", "Almora", "Other / Not Listed",
-    ],
-    "West Bengal": [
-        "Murshidabad", "Bardhaman", "Nadia", "Hooghly", "North 24 Parganas",
-        "South 24 Parganas", "Bankura", "Purulia", "Jalpaiguri",
-        "Cooch Behar", "Malda", "Birbhum", "Other / Not Listed",
-    ],
-    "Jammu and Kashmir": [
-        "Jammu", "Srinagar", "Anantnag", "Baramulla", "Kupwara",
-        "Pulwama", "Kathua", "Udhampur", "Other / Not Listed",
-    ],
-    "Ladakh": [
-        "Leh", "Kargil", "Other / Not Listed",
-    ],
-    "Lakshadweep": [
-        "Kavaratti", "Amini", "Minicoy", "Other / Not Listed",
-    ],
-    "Manipur": [
-        "Imphal East", "Imphal West", "Thoubal", "Bishnupur", "Churachandpur",
-        "Senapati", "Ukhrul", "Tamenglong", "Other / Not Listed",
-    ],
-    "Meghalaya": [
-        "East Khasi Hills", "West Khasi Hills", "Jaintia Hills", "Ri Bhoi",
-        "East Garo Hills", "West Garo Hills", "South Garo Hills", "Other / Not Listed",
-    ],
-    "Mizoram": [
-        "Aizawl", "Lunglei", "Champhai", "Mamit", "Kolasib",
-        "Serchhip", "Lawngtlai", "Saiha", "Other / Not Listed",
-    ],
-    "Nagaland": [
-        "Kohima", "Dimapur", "Mokokchung", "Tuensang", "Wokha",
-        "Zunheboto", "Phek", "Mon", "Other / Not Listed",
-    ],
-    "Puducherry": [
-        "Puducherry", "Karaikal", "Mahe", "Yanam", "Other / Not Listed",
-    ],
-    "Sikkim": [
-        "East Sikkim", "South Sikkim", "West Sikkim", "North Sikkim", "Other / Not Listed",
-    ],
-    "Tripura": [
-        "West Tripura", "South Tripura", "Dhalai", "North Tripura",
-        "Gomati", "Khowai", "Unakoti", "Sepahijala", "Other / Not Listed",
-    ],
-}
 # Fallback for states with no explicit district list (should not be needed if all states are above)
 DEFAULT_DISTRICTS = ["Other / Not Listed (state-level data will be used)"]
 
+# Immutable selectbox options for the app (built once at import)
+STATE_PLACEHOLDER = "— Select State —"
+INDIAN_STATES_WITH_PLACEHOLDER: tuple[str, ...] = (STATE_PLACEHOLDER, *INDIAN_STATES)
+DEFAULT_DISTRICTS_TUPLE: tuple[str, ...] = tuple(DEFAULT_DISTRICTS)
+
 
 # ---------------------------------------------------------------------------
 # Ensure directories exist (called when pipeline / app starts)
 # ---------------------------------------------------------------------------
+_DIRS_READY = False
+
+
 def ensure_dirs():
-    RAW_DATA_DIR.mkdir(parents=True, exist_ok=True)
-    PROCESSED_DATA_DIR.mkdir(parents=True, exist_ok=True)
-    MODELS_DIR.mkdir(parents=True, exist_ok=True)
-    FIGURES_DIR.mkdir(parents=True, exist_ok=True)
+    """Create the data/model/report dirs; later calls in the same process are no-ops."""
+    global _DIRS_READY
+    if _DIRS_READY:
+        return
+    for d in (RAW_DATA_DIR, PROCESSED_DATA_DIR, MODELS_DIR, FIGURES_DIR):
+        os.makedirs(d, exist_ok=True)
+    _DIRS_READY = True
@@ -11,6 +11,7 @@ The generator samples from truncated normal distributions within [min, max].
 
 import numpy as np
 import pandas as pd
+from scipy.special import ndtr, ndtri
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Crop parameter ranges: {crop_name: {feature: (min, max, mean, std)}}
@@ -307,6 +308,64 @@ CROP_PARAMS: dict[str, dict[str, tuple[float, float, float, float]]] = {
 RANDOM_STATE = 42
 
 
+def make_rng(seed=RANDOM_STATE) -> np.random.Generator:
+    """Generator on SFC64, the fastest of NumPy's bit generators for bulk uniform draws.
+    seed may be an int or a SeedSequence (e.g. one spawned per crop)."""
+    return np.random.Generator(np.random.SFC64(seed))
+
+
+FEATURES = ("N", "P", "K", "temperature", "humidity", "ph", "rainfall")
+# (row slice into the (feature, sample) matrix, decimals)
+_ROUNDING = ((slice(0, 3), 0), (slice(3, 5), 1), (slice(5, 6), 2), (slice(6, 7), 1))
+
+# CROP_PARAMS as structure-of-arrays, built once: LO/HI/MU/SIGMA[CROP_INDEX[crop], j]
+# is the (min, max, mean, std) of FEATURES[j]. float64 so samples match the dict exactly.
+CROP_NAMES: tuple[str, ...] = tuple(sorted(CROP_PARAMS))
+CROP_INDEX: dict[str, int] = {c: i for i, c in enumerate(CROP_NAMES)}
+_PARAM_TABLE = np.array([[CROP_PARAMS[c][f] for f in FEATURES] for c in CROP_NAMES], dtype=np.float64)
+_PARAM_TABLE.flags.writeable = False   # the views below inherit this
+LO, HI, MU, SIGMA = _PARAM_TABLE.transpose(2, 0, 1)
+# Normal CDF at each bound, for inverse-CDF truncated-normal sampling
+CDF_LO = ndtr((LO - MU) / SIGMA)
+CDF_HI = ndtr((HI - MU) / SIGMA)
+
+
+def _sample_truncnorm(rng, lo, hi, mu, sigma, cdf_lo, cdf_hi, n_samples: int, out=None) -> np.ndarray:
+    """
+    Rounded truncated-normal samples, shape (..., 7, n_samples), for bound arrays of shape (..., 7).
+
+    Inverse CDF: uniforms are mapped into [Phi(alpha), Phi(beta)] and back through
+    ndtri, so values land inside [lo, hi] without piling up at the bounds. Uniforms
+    are drawn in C order, so a (k, 7, n) batch uses the stream of k consecutive
+    single-crop calls. With out, samples are written into that float64 buffer.
+    """
+    lo, hi, mu, sigma, cdf_lo, cdf_hi = (a[..., None] for a in (lo, hi, mu, sigma, cdf_lo, cdf_hi))
+    # One buffer carries uniforms -> normals -> rounded samples; no temporaries
+    samples = rng.random((*mu.shape[:-1], n_samples), out=out)
+    samples *= cdf_hi - cdf_lo
+    samples += cdf_lo
+    ndtri(samples, out=samples)
+    samples *= sigma
+    samples += mu
+    np.clip(samples, lo, hi, out=samples)   # guards float rounding at the edges only
+    # Round appropriately: NPK to integers, ph to 2 decimals, the rest to 1
+    for rows, decimals in _ROUNDING:
+        block = samples[..., rows, :]   # basic slice, so a view
+        np.round(block, decimals, out=block)
+    return samples
+
+
+def _crop_bounds(crop: str, params: dict | None = None) -> tuple:
+    """(lo, hi, mu, sigma, cdf_lo, cdf_hi) arrays over FEATURES for one crop."""
+    if params:
+        lo, hi, mu, sigma = np.array([params[f] for f in FEATURES], dtype=np.float64).T
+        return lo, hi, mu, sigma, ndtr((lo - mu) / sigma), ndtr((hi - mu) / sigma)
+    if crop in CROP_INDEX:
+        i = CROP_INDEX[crop]
+        return LO[i], HI[i], MU[i], SIGMA[i], CDF_LO[i], CDF_HI[i]
+    raise ValueError(f"No parameter definition for crop '{crop}'")
+
+
 def generate_crop_samples(
     crop: str,
     n_samples: int = 100,
@@ -316,34 +375,23 @@ def generate_crop_samples(
     """
     Generate realistic synthetic training samples for a single crop.
 
-    Uses truncated normal sampling within the agronomically valid
-    [min, max] range for each feature, centered on mean with given std.
+    Uses truncated normal sampling (inverse CDF) within the agronomically
+    valid [min, max] range for each feature, centered on mean with given std.
     """
     if rng is None:
-        rng = np.random.default_rng(RANDOM_STATE)
-
-    p = params or CROP_PARAMS.get(crop)
-    if p is None:
-        raise ValueError(f"No parameter definition for crop '{crop}'")
-
-    features = ["N", "P", "K", "temperature", "humidity", "ph", "rainfall"]
-    rows = {}
-    for feat in features:
-        lo, hi, mu, sigma = p[feat]
-        # Sample from normal, then clip to valid range
-        samples = rng.normal(mu, sigma, size=n_samples)
-        samples = np.clip(samples, lo, hi)
-        # Round appropriately
-        if feat in ("N", "P", "K"):
-            samples = np.round(samples, 0)
-        elif feat == "ph":
-            samples = np.round(samples, 2)
-        else:
-            samples = np.round(samples, 1)
-        rows[feat] = samples
-
-    rows["label"] = crop
-    return pd.DataFrame(rows)
+        rng = make_rng()
+
+    samples = _sample_truncnorm(rng, *_crop_bounds(crop, params), n_samples)
+    df = pd.DataFrame(dict(zip(FEATURES, samples)))
+    # Known crops share the CROP_NAMES categories so per-crop frames concat
+    # without falling back to object dtype. from_codes narrows the codes to the
+    # smallest integer type that fits the category count.
+    if crop in CROP_INDEX:
+        code, categories = CROP_INDEX[crop], CROP_NAMES
+    else:
+        code, categories = 0, [crop]
+    df["label"] = pd.Categorical.from_codes(np.full(n_samples, code), categories=categories)
+    return df
 
 
 def generate_all_new_crops(
@@ -352,10 +400,40 @@ def generate_all_new_crops(
     """
     Generate balanced synthetic training data for all crops in CROP_PARAMS.
     Returns a DataFrame ready to merge with the original Crop_Recommendation.csv.
+
+    All crops are drawn in one batch from the SoA tables; rows come out grouped
+    by crop in CROP_NAMES order, identical to per-crop generate_crop_samples calls
+    sharing one rng.
+    """
+    rng = make_rng()
+    samples = _sample_truncnorm(rng, LO, HI, MU, SIGMA, CDF_LO, CDF_HI, n_samples_per_crop)
+    # (crop, feature, sample) -> one column per feature, crops stacked
+    cols = samples.transpose(1, 0, 2).reshape(len(FEATURES), -1)
+    df = pd.DataFrame(dict(zip(FEATURES, cols)))
+    codes = np.repeat(np.arange(len(CROP_NAMES)), n_samples_per_crop)
+    df["label"] = pd.Categorical.from_codes(codes, categories=CROP_NAMES)
+    return df
+
+
+def generate_samples_for_crops(
+    crops: list[str],
+    n_samples: int,
+    rngs: list[np.random.Generator],
+) -> pd.DataFrame:
+    """
+    Synthetic samples for several CROP_PARAMS crops, each drawn from its own rng.
+
+    Each crop fills its block of one preallocated (crop, feature, sample) buffer
+    and a single DataFrame is built at the end. A plain loop: each draw is a few
+    vectorised passes, so thread dispatch would cost more than it saves.
+    Rows equal concatenating generate_crop_samples(crop, n_samples, rng=rng) per crop.
     """
-    rng = np.random.default_rng(RANDOM_STATE)
-    frames = []
-    for crop in sorted(CROP_PARAMS):
-        df = generate_crop_samples(crop, n_samples_per_crop, rng=rng)
-        frames.append(df)
-    return pd.concat(frames, ignore_index=True)
+    bounds = [_crop_bounds(crop) for crop in crops]   # raises before any sampling
+    buf = np.empty((len(crops), len(FEATURES), n_samples))
+    for k, (b, rng) in enumerate(zip(bounds, rngs)):
+        _sample_truncnorm(rng, *b, n_samples, out=buf[k])
+    cols = buf.transpose(1, 0, 2).reshape(len(FEATURES), -1)
+    df = pd.DataFrame(dict(zip(FEATURES, cols)))
+    codes = np.repeat(np.array([CROP_INDEX[c] for c in crops]), n_samples)
+    df["label"] = pd.Categorical.from_codes(codes, categories=CROP_NAMES)
+    return df
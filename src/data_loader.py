@@ -5,27 +5,69 @@ Loads CSV from data/raw/, normalizes column names, and validates feature columns
 - Drops rows with missing values to avoid downstream errors in scaling and model training.
 """
 
+import csv
 import hashlib
+import importlib.util
+import stat
+import sys
+from functools import lru_cache
 
+import numpy as np
 import pandas as pd
 from pathlib import Path
 
 from src.config import (
     RAW_DATA_DIR,
     FEATURE_COLUMNS,
+    FEATURE_COLUMN_SET,
     TARGET_COLUMN,
     TARGET_ALIASES,
+    TARGET_ALIAS_SET,
     RAW_DATA_FNAME,
     SAMPLE_DATA_FNAME,
     CROP_YIELD_FNAME,
-    get_state_soil_climate,
 )
 
+# Optional: with pyarrow installed, the merge path parses each CSV with Arrow's
+# multithreaded reader; otherwise the pandas C parser is used.
+_HAS_ARROW_CSV = importlib.util.find_spec("pyarrow") is not None
+
+
+def _is_training_column(name: str) -> bool:
+    """read_csv usecols filter: feature columns and target aliases (headers may carry spaces)."""
+    name = name.strip()
+    return name in FEATURE_COLUMN_SET or name in TARGET_ALIAS_SET
+
+
+def _read_training_csv(path: Path) -> pd.DataFrame:
+    """Read only the feature/target columns of a CSV, via Arrow when available."""
+    if _HAS_ARROW_CSV:
+        import pyarrow.csv as pacsv
+
+        # Header names as Arrow sees them (BOM dropped), so only these columns are converted
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            header = next(csv.reader(f), [])
+        keep = [c for c in header if _is_training_column(c)]
+        if not keep:   # include_columns=[] would mean "all columns"
+            return pd.DataFrame()
+        tbl = pacsv.read_csv(
+            path,
+            read_options=pacsv.ReadOptions(use_threads=True),
+            convert_options=pacsv.ConvertOptions(include_columns=keep),
+        )
+        return tbl.to_pandas()
+    return pd.read_csv(path, usecols=_is_training_column)
+
 
 def _normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
     """Ensure we have 'label' as target and standard feature names."""
     cols = [c.strip() for c in df.columns]
-    df = df.set_axis(cols, axis=1)
+    stripped = cols != list(df.columns)
+    has_alias = any(c in TARGET_ALIAS_SET and c != TARGET_COLUMN for c in cols)
+    if not stripped and not has_alias:
+        return df   # common case (canonical CSV): nothing to rename
+    if stripped:
+        df = df.set_axis(cols, axis=1)
     # Map common variants to our expected names
     renames = {}
     for a in TARGET_ALIASES:
@@ -65,10 +107,17 @@ CROP_YIELD_NAME_MAP = {
 }
 
 
-def _normalize_crop_name(crop_name: str) -> str:
-    """Normalize crop name from crop_yield.csv to a clean label."""
-    key = (crop_name or "").strip().lower()
-    return CROP_YIELD_NAME_MAP.get(key, key)
+# The only crop_yield.csv columns the conversion reads
+_CROP_YIELD_COLUMNS = frozenset({"Crop", "State", "Annual_Rainfall"})
+
+# Summary rows in crop_yield.csv, not individual crops
+_AGGREGATE_CROPS = frozenset({
+    "oilseeds total", "other cereals", "other kharif pulses", "other rabi pulses",
+    "other summer pulses", "other oilseeds", "other  rabi pulses",
+})
+
+# Per-feature weight of a (state, crop) pair's hash delta, in N..ph order
+_CROP_YIELD_DELTA_SCALE = np.array([10, 8, 8, 3, 5, 0.5])
 
 
 def load_crop_yield_as_training(base_df: pd.DataFrame | None = None) -> pd.DataFrame | None:
@@ -78,11 +127,18 @@ def load_crop_yield_as_training(base_df: pd.DataFrame | None = None) -> pd.DataF
     Scales Annual_Rainfall to training range (20-300).
     Returns training rows for ALL 55+ crops (not just the 22 in Crop_Recommendation.csv).
     """
+    # Zone tables are lazy in src.config; only this conversion needs them
+    from src.config import ZONE_MATRIX, STATE_ZONE_ROW, FALLBACK_ZONE_ROW
+
     path = RAW_DATA_DIR / CROP_YIELD_FNAME
     if not path.exists():
         return None
     try:
-        cy = pd.read_csv(path)
+        cy = pd.read_csv(
+            path,
+            usecols=lambda c: c.strip() in _CROP_YIELD_COLUMNS,
+            dtype={"Annual_Rainfall": "float64"},
+        )
     except Exception:
         return None
     cols = [c.strip() for c in cy.columns]
@@ -91,66 +147,77 @@ def load_crop_yield_as_training(base_df: pd.DataFrame | None = None) -> pd.DataF
         return None
 
     # Scale Annual_Rainfall: crop_yield range ~300-6500 -> training 20-300
-    r_min = max(1, cy["Annual_Rainfall"].min()) if cy["Annual_Rainfall"].min() > 0 else 301.0
-    r_max = cy["Annual_Rainfall"].max() if cy["Annual_Rainfall"].max() > 0 else 6552.0
+    rain_min, rain_max = cy["Annual_Rainfall"].min(), cy["Annual_Rainfall"].max()
+    r_min = max(1.0, rain_min) if rain_min > 0 else 301.0
+    r_max = rain_max if rain_max > 0 else 6552.0
 
-    def scale_rainfall(x):
-        if r_max <= r_min:
-            return 100.0
-        return round(20 + (300 - 20) * (x - r_min) / (r_max - r_min), 2)
-
-    # If we have base_df, use per-crop medians for known crops
-    known_medians = {}
+    # If we have base_df, use per-crop medians for known crops (label-indexed, FEATURE_COLUMNS order)
+    known_medians = None
     if base_df is not None and len(base_df) > 0:
-        known_medians = base_df.groupby(TARGET_COLUMN)[FEATURE_COLUMNS].median().to_dict("index")
-
-    rows = []
-    for _, r in cy.iterrows():
-        crop_raw = str(r.get("Crop", ""))
-        label = _normalize_crop_name(crop_raw)
-        if not label or label in ("oilseeds total", "other cereals", "other kharif pulses",
-                                   "other rabi pulses", "other summer pulses", "other oilseeds",
-                                   "other  rabi pulses"):
-            continue  # skip aggregate categories
-
-        ar = r.get("Annual_Rainfall")
-        if pd.isna(ar) or ar is None:
-            continue
-        rain = scale_rainfall(float(ar))
-        rain = max(20, min(300, rain))
-
-        state = str(r.get("State", "")).strip()
-
-        # Get soil/climate: use known crop medians if available, else state defaults
-        if label in known_medians:
-            med = known_medians[label]
-            soil = {
-                "N": med["N"], "P": med["P"], "K": med["K"],
-                "temperature": med["temperature"], "humidity": med["humidity"], "ph": med["ph"],
-            }
-        else:
-            soil = get_state_soil_climate(state)
-
-        # Add small variation based on deterministic hash to create diversity
-        # Uses hashlib instead of hash() to avoid PYTHONHASHSEED randomization
-        key = f"{state}|{label}"
-        h = int(hashlib.sha256(key.encode()).hexdigest(), 16) % 100
-        delta = (h - 50) / 100.0  # -0.5 to +0.5
-
-        rows.append({
-            "N": round(soil["N"] + delta * 10, 1),
-            "P": round(soil["P"] + delta * 8, 1),
-            "K": round(soil["K"] + delta * 8, 1),
-            "temperature": round(soil["temperature"] + delta * 3, 2),
-            "humidity": round(soil["humidity"] + delta * 5, 2),
-            "ph": round(soil["ph"] + delta * 0.5, 2),
-            "rainfall": rain,
-            TARGET_COLUMN: label,
-        })
-
-    if not rows:
+        known_medians = base_df.groupby(TARGET_COLUMN)[list(FEATURE_COLUMNS)].median()
+
+    # Whole-column passes instead of iterrows: normalise labels, then drop aggregate
+    # categories and rows without rainfall.
+    crop = cy["Crop"].astype(str).str.strip().str.lower()
+    label = crop.map(CROP_YIELD_NAME_MAP).fillna(crop)
+    if "State" in cy.columns:
+        state = cy["State"].astype(str).str.strip()
+    else:
+        state = pd.Series("", index=cy.index)
+    keep = label.ne("") & ~label.isin(_AGGREGATE_CROPS) & cy["Annual_Rainfall"].notna()
+    label, state = label[keep], state[keep]
+    if label.empty:
         return None
-    return pd.DataFrame(rows)
+    ar = cy.loc[keep, "Annual_Rainfall"].to_numpy(dtype=np.float64)
+    if r_max <= r_min:
+        rain_scaled = np.full_like(ar, 100.0)
+    else:
+        rain_scaled = np.clip(np.round(20 + (300 - 20) * (ar - r_min) / (r_max - r_min), 2), 20, 300)
+
+    # N..ph depend only on (state, label): soil comes from the crop's medians or the
+    # state's zone, and the variation from the pair's hash. Compute each pair once.
+    codes, pairs = pd.factorize(pd.MultiIndex.from_arrays([state, label]))
+    pair_states = [sys.intern(st) for st in pairs.get_level_values(0)]   # shares identity with config keys
+    pair_labels = pairs.get_level_values(1)
+    # Zone defaults for every pair, overwritten by the crop's medians where it has them
+    soil_matrix = ZONE_MATRIX[[STATE_ZONE_ROW.get(st, FALLBACK_ZONE_ROW) for st in pair_states]]
+    if known_medians is not None:
+        aligned = known_medians.reindex(pair_labels).to_numpy(dtype=np.float64)
+        soil_matrix = np.where(np.isnan(aligned), soil_matrix, aligned)
+    # Add small variation based on deterministic hash to create diversity
+    # Uses hashlib instead of hash() to avoid PYTHONHASHSEED randomization
+    h = np.array([
+        int.from_bytes(hashlib.sha256(f"{st}|{lb}".encode()).digest(), "big") % 100
+        for st, lb in zip(pair_states, pair_labels)
+    ], dtype=np.float64)
+    delta = (h - 50) / 100.0  # -0.5 to +0.5
+    pair_feats = soil_matrix[:, :6] + delta[:, None] * _CROP_YIELD_DELTA_SCALE
+    # Python round(): np.round resolves the x.xx5 ties of ph + delta/2 differently
+    pair_rows = [
+        (round(n, 1), round(p, 1), round(k, 1), round(t, 2), round(hu, 2), round(ph, 2))
+        for n, p, k, t, hu, ph in pair_feats.tolist()
+    ]
+    feats = np.array(pair_rows, dtype=np.float64)[codes]
+
+    out = pd.DataFrame(feats, columns=list(FEATURE_COLUMNS[:6]))
+    out["rainfall"] = rain_scaled
+    out[TARGET_COLUMN] = pd.Categorical(label.to_numpy())
+    return out
+
+
+@lru_cache(maxsize=64)
+def _has_training_schema(path: str, mtime_ns: int, size: int) -> bool:
+    """
+    True if the CSV header has every feature column plus a target column.
+    mtime_ns and size are only part of the cache key, so an edited file is re-peeked.
+    """
+    try:
+        # Header line only; utf-8-sig drops a BOM the way read_csv does
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            header = {c.strip() for c in next(csv.reader(f), [])}
+    except (OSError, UnicodeDecodeError, csv.Error):
+        return False
+    return not TARGET_ALIAS_SET.isdisjoint(header) and FEATURE_COLUMN_SET.issubset(header)
 
 
 def get_all_crop_data_paths() -> list[Path]:
@@ -159,18 +226,18 @@ def get_all_crop_data_paths() -> list[Path]:
     (N, P, K, temperature, humidity, ph, rainfall, and label/crop).
     Main file first, then others alphabetically. Use this to merge lots of data.
     """
-    required = set(FEATURE_COLUMNS) | {TARGET_COLUMN}
     candidates = []
     for p in RAW_DATA_DIR.iterdir():
-        if not p.suffix.lower() == ".csv" or not p.is_file():
+        if not p.suffix.lower() == ".csv":
             continue
         try:
-            peek = pd.read_csv(p, nrows=1)
-            peek = _normalize_columns(peek)
-            if TARGET_COLUMN in peek.columns and set(FEATURE_COLUMNS).issubset(peek.columns):
-                candidates.append(p)
-        except Exception:
+            st = p.stat()
+        except OSError:
+            continue
+        if not stat.S_ISREG(st.st_mode):
             continue
+        if _has_training_schema(str(p), st.st_mtime_ns, st.st_size):
+            candidates.append(p)
     # Prefer main file first, then sample, then rest alphabetically
     main = RAW_DATA_DIR / RAW_DATA_FNAME
     sample = RAW_DATA_DIR / SAMPLE_DATA_FNAME
@@ -202,22 +269,22 @@ def load_crop_data(csv_path: Path | None = None, merge_all_compatible: bool = Fa
         if not paths:
             raise FileNotFoundError(
                 f"No compatible CSV found in {RAW_DATA_DIR}. "
-                f"Files must have columns: {FEATURE_COLUMNS + [TARGET_COLUMN]}"
+                f"Files must have columns: {[*FEATURE_COLUMNS, TARGET_COLUMN]}"
             )
         dfs = []
         for path in paths:
-            df = pd.read_csv(path)
+            df = _read_training_csv(path)
             df = _normalize_columns(df)
             if TARGET_COLUMN not in df.columns:
                 continue
             missing = [c for c in FEATURE_COLUMNS if c not in df.columns]
             if missing:
                 continue
-            use_cols = FEATURE_COLUMNS + [TARGET_COLUMN]
+            use_cols = [*FEATURE_COLUMNS, TARGET_COLUMN]
             dfs.append(df[use_cols].dropna())
         if not dfs:
             raise ValueError(
-                f"No CSV in {RAW_DATA_DIR} had required columns: {FEATURE_COLUMNS + [TARGET_COLUMN]}"
+                f"No CSV in {RAW_DATA_DIR} had required columns: {[*FEATURE_COLUMNS, TARGET_COLUMN]}"
             )
         base = pd.concat(dfs, ignore_index=True)
         return base
@@ -228,7 +295,7 @@ def load_crop_data(csv_path: Path | None = None, merge_all_compatible: bool = Fa
             f"Please place 'Crop_Recommendation.csv' in data/raw/ (e.g. from Kaggle: "
             "atharvaingle/crop-recommendation-dataset), or run the project's data preparation step."
         )
-    df = pd.read_csv(path)
+    df = _read_training_csv(path)
     df = _normalize_columns(df)
     if TARGET_COLUMN not in df.columns:
         raise ValueError(
@@ -238,6 +305,6 @@ def load_crop_data(csv_path: Path | None = None, merge_all_compatible: bool = Fa
     if missing:
         raise ValueError(f"Missing feature columns: {missing}. Available: {list(df.columns)}")
     # Use only required columns and drop rows with missing values
-    use_cols = FEATURE_COLUMNS + [TARGET_COLUMN]
+    use_cols = [*FEATURE_COLUMNS, TARGET_COLUMN]
     df = df[use_cols].dropna()
     return df
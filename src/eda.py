@@ -4,6 +4,8 @@ Generates distribution plots, class balance, correlation matrix, outlier checks,
 and saves all figures to reports/figures/ for the report and README.
 """
 
+import warnings
+
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
@@ -47,10 +49,10 @@ def plot_distributions(df: pd.DataFrame, target_col: str = TARGET_COLUMN) -> Pat
         ax.set_ylabel("Count")
     for j in range(i + 1, axes.size):
         axes.flat[j].set_visible(False)
-    fig.suptitle("Feature distributions (all samples)", fontsize=12, y=1.02)
-    plt.tight_layout()
+    fig.suptitle("Feature distributions (all samples)", fontsize=12)
+    plt.tight_layout()   # also reserves room for the suptitle, so savefig needs no tight bbox
     out = FIGURES_DIR / "feature_distributions.png"
-    fig.savefig(out, bbox_inches="tight")
+    fig.savefig(out)
     plt.close()
     return out
 
@@ -70,7 +72,7 @@ def plot_class_balance(df: pd.DataFrame, target_col: str = TARGET_COLUMN) -> Pat
     ax.set_title("Class balance — number of samples per crop")
     plt.tight_layout()
     out = FIGURES_DIR / "class_balance.png"
-    fig.savefig(out, bbox_inches="tight")
+    fig.savefig(out)
     plt.close()
     return out
 
@@ -89,7 +91,7 @@ def plot_correlation_matrix(df: pd.DataFrame) -> Path:
     ax.set_title("Correlation matrix (features)")
     plt.tight_layout()
     out = FIGURES_DIR / "correlation_matrix.png"
-    fig.savefig(out, bbox_inches="tight")
+    fig.savefig(out)
     plt.close()
     return out
 
@@ -100,28 +102,37 @@ def report_outliers(df: pd.DataFrame, method: str = "iqr") -> dict:
     Method 'iqr': values outside Q1 - 1.5*IQR or Q3 + 1.5*IQR.
     """
     features = [c for c in FEATURE_COLUMNS if c in df.columns]
-    out = {}
-    for col in features:
-        x = df[col].dropna()
+    if not features:
+        return {}
+    # All features at once; NaNs stand in for dropna (never counted, excluded from stats)
+    arr = df[features].to_numpy(dtype=np.float64)
+    total = (~np.isnan(arr)).sum(axis=0)
+    # An all-NaN (or single-value) column just yields NaN stats and zero counts,
+    # as the per-column Series methods did; silence numpy's nan* RuntimeWarnings.
+    with np.errstate(invalid="ignore"), warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
         if method == "iqr":
-            q1, q3 = x.quantile(0.25), x.quantile(0.75)
+            q1, q3 = np.nanquantile(arr, [0.25, 0.75], axis=0)
             iqr = q3 - q1
             low, high = q1 - 1.5 * iqr, q3 + 1.5 * iqr
-            n_below = (x < low).sum()
-            n_above = (x > high).sum()
+            n_below = (arr < low).sum(axis=0)
+            n_above = (arr > high).sum(axis=0)
         else:
-            z = np.abs((x - x.mean()) / (x.std() + 1e-8))
-            n_below = 0
-            n_above = (z > 3).sum()
-        out[col] = {"n_low": int(n_below), "n_high": int(n_above), "total": len(x)}
+            z = np.abs((arr - np.nanmean(arr, axis=0)) / (np.nanstd(arr, axis=0, ddof=1) + 1e-8))
+            n_below = np.zeros(len(features), dtype=np.int64)
+            n_above = (z > 3).sum(axis=0)
+    out = {
+        col: {"n_low": int(lo), "n_high": int(hi), "total": int(n)}
+        for col, lo, hi, n in zip(features, n_below, n_above, total)
+    }
     return out
 
 
-def plot_outlier_summary(df: pd.DataFrame) -> Path:
-    """Bar plot of outlier counts per feature (IQR-based)."""
+def plot_outlier_summary(df: pd.DataFrame, outlier_report: dict | None = None) -> Path:
+    """Bar plot of outlier counts per feature (IQR-based). Pass outlier_report to reuse an IQR report."""
     ensure_dirs()
     _setup_style()
-    outlier_counts = report_outliers(df, method="iqr")
+    outlier_counts = outlier_report if outlier_report is not None else report_outliers(df, method="iqr")
     features = list(outlier_counts.keys())
     n_low = [outlier_counts[c]["n_low"] for c in features]
     n_high = [outlier_counts[c]["n_high"] for c in features]
@@ -137,7 +148,7 @@ def plot_outlier_summary(df: pd.DataFrame) -> Path:
     ax.legend()
     plt.tight_layout()
     out = FIGURES_DIR / "outliers_summary.png"
-    fig.savefig(out, bbox_inches="tight")
+    fig.savefig(out)
     plt.close()
     return out
 
@@ -152,8 +163,8 @@ def run_full_eda(df: pd.DataFrame) -> dict:
     paths["distributions"] = plot_distributions(df)
     paths["class_balance"] = plot_class_balance(df)
     paths["correlation"] = plot_correlation_matrix(df)
-    paths["outliers"] = plot_outlier_summary(df)
     outlier_report = report_outliers(df)
+    paths["outliers"] = plot_outlier_summary(df, outlier_report=outlier_report)
     n_classes = df[TARGET_COLUMN].nunique()
     n_samples = len(df)
     balance_ratio = df[TARGET_COLUMN].value_counts()
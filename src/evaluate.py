@@ -99,6 +99,6 @@ def plot_learning_curve(
     ax.grid(True)
     plt.tight_layout()
     path = out_path or (FIGURES_DIR / "learning_curve.png")
-    fig.savefig(path, bbox_inches="tight")
+    fig.savefig(path)
     plt.close()
     return path
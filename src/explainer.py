@@ -151,6 +151,6 @@ def plot_feature_importance_bar(importance_dict: dict, title: str = "Feature imp
     ax.set_xlabel("Importance")
     ax.set_title(title)
     plt.tight_layout()
-    fig.savefig(path, bbox_inches="tight")
+    fig.savefig(path)
     plt.close()
     return path
@@ -13,6 +13,10 @@ Or call from code:
     from src.market_price_fetcher import fetch_and_save
     fetch_and_save(api_key="YOUR_KEY")
 
+    # Top-up: append only rows newer than the last fetch (see fetch_and_append)
+    from src.market_price_fetcher import fetch_and_append
+    fetch_and_append(api_key="YOUR_KEY", state_filter="Punjab")
+
 API key:
     Get your free key at https://data.gov.in → My Account → API Keys
     The sample key (579b464db66ec23bdd000001cdd3946e44ce4aad7209ff7b23ac571b)
@@ -24,6 +28,7 @@ Output:
 """
 
 import argparse
+import json
 import logging
 import time
 from pathlib import Path
@@ -31,7 +36,7 @@ from pathlib import Path
 import pandas as pd
 import requests
 
-from src.config import RAW_DATA_DIR, MARKET_PRICE_FNAME
+from src.config import RAW_DATA_DIR, MARKET_PRICE_FNAME, MARKET_PRICE_WATERMARK_FNAME
 
 log = logging.getLogger(__name__)
 
@@ -48,12 +53,24 @@ REQUEST_TIMEOUT = 30      # seconds
 KEEP_COLS = ["state", "district", "market", "commodity", "variety",
              "arrival_date", "min_price", "max_price", "modal_price"]
 
+ARRIVAL_DATE_FORMAT = "%d/%m/%Y"   # as returned by the API, e.g. "04/03/2019"
+ALL_STATES_KEY      = "__all__"    # watermark key when no state filter is used
+DEDUP_COLS          = ["state", "district", "commodity", "arrival_date"]
+_CACHE_CHUNK_ROWS   = 100_000      # rows per read when scanning the cache for dedup
+MAX_INCREMENTAL_DAYS = 31          # older watermarks fall back to one full fetch
+
 
 def _is_sample_key(api_key: str) -> bool:
     return api_key.strip() == SAMPLE_API_KEY
 
 
-def _make_request(api_key: str, offset: int, limit: int, state_filter: str | None) -> dict:
+def _make_request(
+    api_key: str,
+    offset: int,
+    limit: int,
+    state_filter: str | None,
+    arrival_date: str | None = None,
+) -> dict:
     """
     Make one paginated GET request to the data.gov.in API.
     Returns parsed JSON dict.
@@ -64,9 +81,11 @@ def _make_request(api_key: str, offset: int, limit: int, state_filter: str | Non
         "offset":  offset,
         "limit":   limit,
     }
+    # data.gov.in supports simple (exact-match) field filtering via filters[field]=value
     if state_filter:
-        # data.gov.in supports simple field filtering via filters[field]=value
         params["filters[state]"] = state_filter
+    if arrival_date:
+        params["filters[arrival_date]"] = arrival_date
 
     resp = requests.get(API_BASE_URL, params=params, timeout=REQUEST_TIMEOUT)
     resp.raise_for_status()
@@ -77,6 +96,7 @@ def fetch_all_records(
     api_key: str,
     state_filter: str | None = None,
     max_records: int = 50_000,
+    arrival_date: str | None = None,
 ) -> pd.DataFrame:
     """
     Fetch market price records from data.gov.in API with pagination.
@@ -90,6 +110,8 @@ def fetch_all_records(
         Optional state name to filter (e.g. "Punjab").  Reduces download size.
     max_records : int
         Safety cap on total records to fetch (default 50,000).
+    arrival_date : str or None
+        Optional single day, in ARRIVAL_DATE_FORMAT (e.g. "04/03/2019").
 
     Returns
     -------
@@ -104,7 +126,7 @@ def fetch_all_records(
 
     # First call: get total record count
     log.info("Fetching API metadata (limit=1)...")
-    meta = _make_request(api_key, offset=0, limit=1, state_filter=state_filter)
+    meta = _make_request(api_key, offset=0, limit=1, state_filter=state_filter, arrival_date=arrival_date)
     total = int(meta.get("total", 0))
 
     if total == 0:
@@ -119,7 +141,9 @@ def fetch_all_records(
 
     while offset < min(total, max_records):
         log.info("Fetching offset=%d / %d ...", offset, total)
-        data = _make_request(api_key, offset=offset, limit=limit, state_filter=state_filter)
+        data = _make_request(
+            api_key, offset=offset, limit=limit, state_filter=state_filter, arrival_date=arrival_date
+        )
         records = data.get("records", [])
         if not records:
             log.info("No more records returned at offset=%d. Stopping.", offset)
@@ -161,7 +185,7 @@ def save_to_csv(df: pd.DataFrame, output_path: Path, append: bool = True) -> Pat
         existing = pd.read_csv(output_path, low_memory=False)
         combined = pd.concat([existing, df], ignore_index=True)
         # Deduplicate on key fields if they exist
-        dedup_cols = [c for c in ["state", "district", "commodity", "arrival_date"] if c in combined.columns]
+        dedup_cols = [c for c in DEDUP_COLS if c in combined.columns]
         if dedup_cols:
             combined = combined.drop_duplicates(subset=dedup_cols, keep="last")
         df = combined
@@ -204,6 +228,135 @@ def fetch_and_save(
     return save_to_csv(df, out, append=append)
 
 
+def _arrival_dates(df: pd.DataFrame) -> pd.Series:
+    return pd.to_datetime(df["arrival_date"], format=ARRIVAL_DATE_FORMAT, errors="coerce")
+
+
+def _load_watermarks(path: Path) -> dict:
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _save_watermarks(path: Path, watermarks: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(watermarks, f, indent=2, sort_keys=True)
+
+
+def _fetch_since(
+    api_key: str,
+    state_filter: str | None,
+    max_records: int,
+    since: pd.Timestamp,
+) -> pd.DataFrame:
+    """
+    Records with arrival_date from since through today, one date-filtered query
+    per day, so a top-up downloads only the delta.  Watermarks older than
+    MAX_INCREMENTAL_DAYS fall back to a single unfiltered fetch.
+    """
+    days = pd.date_range(since, pd.Timestamp.today().normalize(), freq="D")
+    if len(days) > MAX_INCREMENTAL_DAYS:
+        return fetch_all_records(api_key, state_filter=state_filter, max_records=max_records)
+    frames = [
+        fetch_all_records(
+            api_key, state_filter=state_filter, max_records=max_records,
+            arrival_date=day.strftime(ARRIVAL_DATE_FORMAT),
+        )
+        for day in days
+    ]
+    frames = [f for f in frames if not f.empty]
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=KEEP_COLS)
+
+
+def _dedup_keys(df: pd.DataFrame, cols: list[str]) -> pd.MultiIndex:
+    """DEDUP_COLS of df as strings, with missing values as "" (how to_csv writes them)."""
+    return pd.MultiIndex.from_frame(df[cols].astype(object).fillna("").astype(str))
+
+
+def _cached_rows_for_dates(path: Path, cols: list[str], arrival_dates: pd.Series) -> pd.DataFrame:
+    """
+    cols of the cached rows whose arrival_date is one of arrival_dates.  Only those
+    can share a dedup key with the fetched rows, so the rest of the cache (everything
+    before the watermark) is dropped chunk by chunk instead of being held and hashed.
+    """
+    wanted = set(arrival_dates.astype(object).fillna("").astype(str))
+    chunks = pd.read_csv(path, usecols=cols, dtype=str, keep_default_na=False, chunksize=_CACHE_CHUNK_ROWS)
+    if "arrival_date" in cols:
+        kept = [chunk[chunk["arrival_date"].isin(wanted)] for chunk in chunks]
+    else:
+        kept = list(chunks)
+    return pd.concat(kept, ignore_index=True) if kept else pd.DataFrame(columns=cols)
+
+
+def fetch_and_append(
+    api_key: str,
+    state_filter: str | None = None,
+    max_records: int = 50_000,
+    output_path: Path | None = None,
+    watermark_path: Path | None = None,
+) -> int:
+    """
+    Incremental refresh: fetch only rows with arrival_date on or after the last
+    fetch for this state filter, and append the ones not already cached to the
+    CSV without rewriting it.
+
+    The per-filter watermark (latest arrival_date seen) lives in a JSON sidecar
+    next to the CSV.  The watermark day itself is fetched again, because rows for
+    it can be published later; rows whose (state, district, commodity,
+    arrival_date) is already in the CSV are skipped, as save_to_csv's dedup
+    would, which also covers overlap between filters (a state fetch followed by
+    an all-states fetch).  With no watermark yet, falls back to a full merge via
+    save_to_csv and records one.
+
+    Returns
+    -------
+    Number of rows added to the cache (0 means no new rows).
+    """
+    out = output_path or (RAW_DATA_DIR / MARKET_PRICE_FNAME)
+    wm_path = watermark_path or (RAW_DATA_DIR / MARKET_PRICE_WATERMARK_FNAME)
+    key = state_filter or ALL_STATES_KEY
+    watermarks = _load_watermarks(wm_path)
+    since = watermarks.get(key)
+    incremental = since is not None and out.exists()
+
+    if incremental:
+        df = _fetch_since(api_key, state_filter, max_records, pd.Timestamp(since))
+    else:
+        df = fetch_all_records(api_key, state_filter=state_filter, max_records=max_records)
+    if df.empty or "arrival_date" not in df.columns:
+        log.warning("No data fetched. market_prices.csv not updated.")
+        return 0
+
+    dates = _arrival_dates(df)
+    new = df[dates >= pd.Timestamp(since)] if incremental else df
+    dedup_cols = [c for c in DEDUP_COLS if c in new.columns]
+    if dedup_cols:
+        new = new.drop_duplicates(subset=dedup_cols, keep="last")
+    header = pd.read_csv(out, nrows=0).columns if out.exists() else None
+    cached_cols = [c for c in dedup_cols if c in header] if header is not None else []
+    if cached_cols and not new.empty:
+        cached = _cached_rows_for_dates(out, cached_cols, new["arrival_date"])
+        new = new[~_dedup_keys(new, cached_cols).isin(_dedup_keys(cached, cached_cols))]
+    added = len(new)
+
+    if not incremental:
+        save_to_csv(df, out, append=True)
+    elif added:
+        new.reindex(columns=header).to_csv(out, mode="a", header=False, index=False)
+        log.info("Appended %d new rows to %s", added, out)
+    else:
+        log.info("No new rows since %s for %s.", since, key)
+
+    latest = dates.max()
+    if pd.notna(latest) and (since is None or latest > pd.Timestamp(since)):
+        watermarks[key] = latest.strftime("%Y-%m-%d")
+        _save_watermarks(wm_path, watermarks)
+    return added
+
+
 def get_data_status() -> dict:
     """Return status of the local market prices cache."""
     path = RAW_DATA_DIR / MARKET_PRICE_FNAME
@@ -13,6 +13,7 @@ If omitted the function behaves like the original top-3 suitability-only mode,
 but using national averages and returning top-5 instead of 3.
 """
 
+import heapq
 import json
 import logging
 import joblib
@@ -30,12 +31,9 @@ from src.config import (
     TOP_K_CROPS,
     CANDIDATES_POOL,
     MIN_SUITABILITY_PCT,
-    SCORING_MODE,
-    W_SUITABILITY,
-    W_PROFIT,
-    W_RISK,
-    CROP_MIN_LAND_ACRES,
-    DEFAULT_MIN_LAND_ACRES,
+    SCORING,
+    ScoringCfg,
+    min_land_for,
 )
 from src.soil_health import get_soil_health_messages, get_crop_specific_suggestions
 from src.explainer import (
@@ -61,9 +59,14 @@ log = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 
 def load_artifacts(models_dir: Path | None = None):
-    """Load model, scaler, label encoder, and metadata from models/."""
+    """
+    Load model, scaler, label encoder, and metadata from models/.
+    The model is memory-mapped (saved uncompressed by train.save_artifacts), so its
+    arrays are paged in from disk instead of copied. Copy-on-write ("c") rather
+    than "r": libsvm's Cython wrapper rejects read-only buffers.
+    """
     d = models_dir or MODELS_DIR
-    model         = joblib.load(d / MODEL_ARTIFACT_NAME)
+    model         = joblib.load(d / MODEL_ARTIFACT_NAME, mmap_mode="c")
     scaler        = joblib.load(d / SCALER_ARTIFACT_NAME)
     label_encoder = joblib.load(d / ENCODER_ARTIFACT_NAME)
     with open(d / METADATA_FNAME) as f:
@@ -92,15 +95,16 @@ def _balanced_score(
     suitability_norm: float,
     profit_norm: float,
     risk_norm: float,
+    cfg: ScoringCfg = SCORING,
 ) -> float:
     """
     Weighted score for balanced ranking mode.
     Higher is better; risk_norm is subtracted (higher risk → lower score).
     """
     return round(
-        W_SUITABILITY * suitability_norm
-        + W_PROFIT     * profit_norm
-        - W_RISK       * risk_norm,
+        cfg.w_suitability * suitability_norm
+        + cfg.w_profit    * profit_norm
+        - cfg.w_risk      * risk_norm,
         4,
     )
 
@@ -115,64 +119,33 @@ def _normalise_list(values: list[float]) -> list[float]:
 
 
 # ---------------------------------------------------------------------------
-# Main prediction API
+# ML scoring (depends only on the soil/climate inputs)
 # ---------------------------------------------------------------------------
 
-def predict_crop(
+def score_crops(
     N, P, K, temperature, humidity, ph, rainfall,
-    land_size_bigha: float = 1.0,
-    state: str | None = None,
-    district: str | None = None,
-    scoring_mode: str | None = None,
     models_dir: Path | None = None,
     X_test_sample=None,
     y_test_sample=None,
+    artifacts: tuple | None = None,
 ) -> dict:
     """
-    Full prediction + economic analysis API.
+    Model inference and candidate selection for one set of soil/climate inputs.
 
-    Parameters
-    ----------
-    N, P, K, temperature, humidity, ph, rainfall : numeric
-        Soil and climate inputs.
-    land_size_bigha : float
-        Farm size in bigha. Converted to acres using state-specific factor.
-    state : str or None
-        Indian state for region-specific data lookup.
-    district : str or None
-        District within the state (preferred over state-level data).
-    scoring_mode : str or None
-        "profit" (default) or "balanced". Overrides config default if given.
-    models_dir : Path or None
-        Override for models directory.
-    X_test_sample, y_test_sample : optional arrays
-        Used only for permutation importance if no importance dict exists.
+    Independent of land size, region and scoring mode, so callers can cache it
+    and re-run only the cheap economics step (predict_crop(..., scores=...))
+    when those change.
 
     Returns
     -------
     dict with keys:
-        top5              : list of crop result dicts (see below)
-        explanation       : str (global feature-based explanation)
+        soil_climate         : dict of the seven input features (as floats)
+        candidates           : list of (crop, confidence, is_genuine), most suitable first
+        explanation          : str (global feature-based explanation)
         soil_health_messages : list[str]
-        crop_suggestions  : list[str] (for top recommended crop)
-        land_size_acres   : float
-        bigha_factor      : float (acres per bigha for this state)
-        scoring_mode      : str
-        region            : dict {state, district}
-
-    Each crop result dict:
-        rank, crop, suitability_pct,
-        yield_q_per_bigha, total_production_quintals,
-        price_per_quintal, gross_revenue_inr, input_cost_inr,
-        net_profit_inr, profit_per_bigha_inr, roi_pct,
-        risk_score, risk_label,
-        disease_risks (list), prevention_measures (list),
-        explanation (crop-specific),
-        data_confidence
     """
-    mode = (scoring_mode or SCORING_MODE).lower()
-    model, scaler, label_encoder, metadata = load_artifacts(models_dir)
-    feature_names = metadata.get("feature_names", FEATURE_COLUMNS)
+    model, scaler, label_encoder, metadata = artifacts or load_artifacts(models_dir)
+    feature_names = metadata.get("feature_names", list(FEATURE_COLUMNS))
 
     # Build feature vector (DataFrame preserves feature names for scaler)
     fd = _feature_dict(N, P, K, temperature, humidity, ph, rainfall)
@@ -216,7 +189,107 @@ def predict_crop(
     # Cap pool at CANDIDATES_POOL before profit-ranking
     top_indices = above[:CANDIDATES_POOL]
     # Track which crops genuinely passed the original gate (>= MIN_SUITABILITY_PCT)
-    genuine_indices = set(i for i in top_indices if probs[i] >= min_prob)
+    candidates = [(classes[i], float(probs[i]), bool(probs[i] >= min_prob)) for i in top_indices]
+
+    # ---------------------------------------------------------------------------
+    # Global explanation (feature importance / SHAP)
+    # ---------------------------------------------------------------------------
+    importance_dict = metadata.get("feature_importance")
+    if not importance_dict and hasattr(model, "feature_importances_"):
+        importance_dict = dict(zip(feature_names, model.feature_importances_.tolist()))
+    if X_test_sample is not None and y_test_sample is not None and not importance_dict:
+        importance_dict = get_importance_dict(model, X_test_sample, y_test_sample, feature_names)
+    importance_dict = importance_dict or {}
+
+    explanation = explain_prediction_with_importance(model, X_scaled, feature_names, importance_dict)
+    shap_text   = explain_prediction_shap_text(model, X_scaled, feature_names, classes)
+    if shap_text:
+        explanation = explanation + " " + shap_text
+
+    return {
+        "soil_climate":         fd,
+        "candidates":           candidates,
+        "explanation":          explanation,
+        "soil_health_messages": get_soil_health_messages(fd),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Main prediction API
+# ---------------------------------------------------------------------------
+
+def predict_crop(
+    N, P, K, temperature, humidity, ph, rainfall,
+    land_size_bigha: float = 1.0,
+    state: str | None = None,
+    district: str | None = None,
+    scoring_mode: str | None = None,
+    models_dir: Path | None = None,
+    X_test_sample=None,
+    y_test_sample=None,
+    artifacts: tuple | None = None,
+    scores: dict | None = None,
+) -> dict:
+    """
+    Full prediction + economic analysis API.
+
+    Parameters
+    ----------
+    N, P, K, temperature, humidity, ph, rainfall : numeric
+        Soil and climate inputs.
+    land_size_bigha : float
+        Farm size in bigha. Converted to acres using state-specific factor.
+    state : str or None
+        Indian state for region-specific data lookup.
+    district : str or None
+        District within the state (preferred over state-level data).
+    scoring_mode : str or None
+        "profit" (default) or "balanced". Overrides config default if given.
+    models_dir : Path or None
+        Override for models directory.
+    X_test_sample, y_test_sample : optional arrays
+        Used only for permutation importance if no importance dict exists.
+    artifacts : tuple or None
+        Preloaded (model, scaler, label_encoder, metadata) as returned by
+        load_artifacts(). Lets callers that cache artifacts skip the joblib
+        reload; the objects are only read, never mutated.
+    scores : dict or None
+        Output of score_crops() for these same soil/climate inputs. When given,
+        model inference is skipped and only the region/land economics run.
+
+    Returns
+    -------
+    dict with keys:
+        top5              : list of crop result dicts (see below)
+        explanation       : str (global feature-based explanation)
+        soil_health_messages : list[str]
+        crop_suggestions  : list[str] (for top recommended crop)
+        land_size_acres   : float
+        bigha_factor      : float (acres per bigha for this state)
+        scoring_mode      : str
+        region            : dict {state, district}
+        soil_climate      : dict of the seven input features (as floats)
+
+    Each crop result dict:
+        rank, crop, suitability_pct,
+        yield_q_per_bigha, total_production_quintals,
+        price_per_quintal, gross_revenue_inr, input_cost_inr,
+        net_profit_inr, profit_per_bigha_inr, roi_pct,
+        risk_score, risk_label,
+        disease_risks (list), prevention_measures (list),
+        explanation (crop-specific),
+        data_confidence
+    """
+    mode = (scoring_mode or SCORING.mode).lower()
+    if scores is None:
+        scores = score_crops(
+            N, P, K, temperature, humidity, ph, rainfall,
+            models_dir=models_dir,
+            X_test_sample=X_test_sample,
+            y_test_sample=y_test_sample,
+            artifacts=artifacts,
+        )
+    fd = scores["soil_climate"]
 
     # Land size in acres
     bigha_factor    = get_bigha_factor(state)
@@ -226,9 +299,7 @@ def predict_crop(
     # Build per-crop data: suitability + profit + risk
     # ---------------------------------------------------------------------------
     crop_data = []
-    for idx in top_indices:
-        crop = classes[idx]
-        conf = float(probs[idx])
+    for crop, conf, is_genuine in scores["candidates"]:
 
         # Region context (yield, price, cost, vulnerability)
         region_ctx = get_region_context(crop, state, district)
@@ -258,7 +329,7 @@ def predict_crop(
             "crop":                    crop,
             "suitability_conf":        conf,
             "suitability_pct":         round(conf * 100, 1),
-            "is_genuine":              (idx in genuine_indices),
+            "is_genuine":              is_genuine,
             "yield_q_per_bigha":       yield_q_per_bigha,
             "total_production_quintals": profit_data["total_production_quintals"],
             "price_per_quintal":       profit_data["price_per_quintal"],
@@ -282,12 +353,9 @@ def predict_crop(
     # Land-size filter: exclude crops that require more space than the user has
     # (e.g. sugarcane needs 2+ acres; pulses work on 0.1 acres)
     # ---------------------------------------------------------------------------
-    def _min_land_for_crop(crop: str) -> float:
-        return CROP_MIN_LAND_ACRES.get(crop.strip().lower(), DEFAULT_MIN_LAND_ACRES)
-
     crop_data_filtered = [
         c for c in crop_data
-        if land_size_acres >= _min_land_for_crop(c["crop"])
+        if land_size_acres >= min_land_for(c["crop"])
     ]
     if len(crop_data_filtered) >= TOP_K_CROPS:
         crop_data = crop_data_filtered
@@ -310,7 +378,8 @@ def predict_crop(
     elif mode == "suitability":
         # Top 5 strongest matches for the region: rank by suitability (ML confidence) only.
         # Use crop name as tie-breaker so equal suitability always gives the same order.
-        ranked = sorted(
+        ranked = heapq.nsmallest(
+            TOP_K_CROPS,
             crop_data,
             key=lambda x: (-x["suitability_conf"], x["crop"]),
         )
@@ -326,10 +395,12 @@ def predict_crop(
         norm_p = _normalise_list(profits)
         norm_r = _normalise_list(risks)
 
+        cfg = SCORING
         for i, c in enumerate(crop_data):
-            c["final_score"] = _balanced_score(norm_s[i], norm_p[i], norm_r[i])
+            c["final_score"] = _balanced_score(norm_s[i], norm_p[i], norm_r[i], cfg)
 
-        ranked = sorted(
+        ranked = heapq.nsmallest(
+            TOP_K_CROPS,
             crop_data,
             key=lambda x: (-x.get("final_score", 0), x["crop"]),
         )
@@ -341,36 +412,21 @@ def predict_crop(
     for i, c in enumerate(ranked, 1):
         c.setdefault("rank", i)
 
-    # ---------------------------------------------------------------------------
-    # Global explanation (feature importance / SHAP)
-    # ---------------------------------------------------------------------------
-    importance_dict = metadata.get("feature_importance")
-    if not importance_dict and hasattr(model, "feature_importances_"):
-        importance_dict = dict(zip(feature_names, model.feature_importances_.tolist()))
-    if X_test_sample is not None and y_test_sample is not None and not importance_dict:
-        importance_dict = get_importance_dict(model, X_test_sample, y_test_sample, feature_names)
-    importance_dict = importance_dict or {}
-
-    explanation = explain_prediction_with_importance(model, X_scaled, feature_names, importance_dict)
-    shap_text   = explain_prediction_shap_text(model, X_scaled, feature_names, classes)
-    if shap_text:
-        explanation = explanation + " " + shap_text
-
     # ---------------------------------------------------------------------------
     # Soil health messages (global, for top crop)
     # ---------------------------------------------------------------------------
-    soil_health_messages = get_soil_health_messages(fd)
     best_crop            = ranked[0]["crop"]
     crop_suggestions     = get_crop_specific_suggestions(best_crop, fd)
 
     return {
         "top5":                  ranked,
-        "explanation":           explanation,
-        "soil_health_messages":  soil_health_messages,
+        "explanation":           scores["explanation"],
+        "soil_health_messages":  list(scores["soil_health_messages"]),
         "crop_suggestions":      crop_suggestions,
         "land_size_acres":       land_size_acres,
         "land_size_bigha":       land_size_bigha,
         "bigha_factor":          bigha_factor,
         "scoring_mode":          mode,
         "region":                {"state": state or "Not specified", "district": district or "Not specified"},
+        "soil_climate":          fd,
     }
@@ -24,7 +24,7 @@ def prepare_X_y(df: pd.DataFrame):
     X: numeric features only (N, P, K, temperature, humidity, ph, rainfall).
     y: crop labels (string).
     """
-    X = df[FEATURE_COLUMNS].astype(float)
+    X = df[list(FEATURE_COLUMNS)].astype(float)
     y = df[TARGET_COLUMN].astype(str).str.strip()
     return X, y
 
@@ -99,5 +99,5 @@ def preprocess_pipeline(df: pd.DataFrame):
         y_test,
         scaler,
         label_encoder,
-        FEATURE_COLUMNS,
+        list(FEATURE_COLUMNS),
     )
@@ -13,7 +13,7 @@ Yield adjustment:
       - suitability_conf = 0.0 → 60% of regional yield (minimum conservative estimate)
 """
 
-from src.config import YIELD_BASE_FACTOR, YIELD_CONF_FACTOR
+from src.config import SCORING
 
 
 def compute_profit(
@@ -57,7 +57,7 @@ def compute_profit(
     price        = float(region_context["price_per_quintal"])
     cost_per_acre = float(region_context["cost_per_acre"])
 
-    effective_yield   = base_yield * (YIELD_BASE_FACTOR + YIELD_CONF_FACTOR * conf)
+    effective_yield   = base_yield * (SCORING.yield_base + SCORING.yield_conf * conf)
     total_production  = round(effective_yield * land, 2)
     gross_revenue     = round(total_production * price, 0)
     total_cost        = round(cost_per_acre * land, 0)
@@ -18,6 +18,7 @@ Expected CSV schemas (place files in data/raw/):
   climate_vulnerability.csv : State, District, Vulnerability_Index
 """
 
+import importlib.util
 import logging
 import pandas as pd
 from functools import lru_cache
@@ -31,12 +32,15 @@ from src.config import (
     COST_CULTIVATION_FNAME,
     CLIMATE_RISK_FNAME,
     UNIFIED_REGION_FNAME,
-    BIGHA_TO_ACRES,
-    DEFAULT_BIGHA_ACRES,
+    BIGHA_TO_ACRES_D,
 )
 
 log = logging.getLogger(__name__)
 
+# Optional: with pyarrow installed, each CSV is mirrored to a Parquet copy in
+# data/processed/ and read from there while the CSV's mtime and size are unchanged.
+_HAS_PARQUET = importlib.util.find_spec("pyarrow") is not None
+
 # ---------------------------------------------------------------------------
 # Crop-name normalisation map
 # Covers common variants across government datasets and the ML label set.
@@ -195,19 +199,19 @@ def bigha_to_acres(bigha: float, state: str | None = None) -> float:
     Convert bigha to acres using state-specific conversion factor.
     Falls back to DEFAULT_BIGHA_ACRES if state is unknown.
     """
-    factor = BIGHA_TO_ACRES.get(state or "", DEFAULT_BIGHA_ACRES)
+    factor = BIGHA_TO_ACRES_D[state]
     return round(bigha * factor, 4)
 
 
 def acres_to_bigha(acres: float, state: str | None = None) -> float:
     """Inverse of bigha_to_acres — for display purposes."""
-    factor = BIGHA_TO_ACRES.get(state or "", DEFAULT_BIGHA_ACRES)
+    factor = BIGHA_TO_ACRES_D[state]
     return round(acres / factor, 4) if factor else acres
 
 
 def get_bigha_factor(state: str | None = None) -> float:
     """Return acres-per-bigha for a given state."""
-    return BIGHA_TO_ACRES.get(state or "", DEFAULT_BIGHA_ACRES)
+    return BIGHA_TO_ACRES_D[state]
 
 
 # ---------------------------------------------------------------------------
@@ -215,20 +219,37 @@ def get_bigha_factor(state: str | None = None) -> float:
 # ---------------------------------------------------------------------------
 
 def _read_csv_safe(path: Path, label: str) -> pd.DataFrame | None:
-    """Read a CSV; log and return None on any error."""
+    """Read a CSV (or its fresh Parquet mirror); log and return None on any error."""
     if not path.exists():
         log.debug("%s dataset not found at %s — using fallback data.", label, path)
         return None
     try:
+        # The mirror's name carries the source's (mtime_ns, size): a CSV replaced by
+        # cp -p / rsync -a / an archive extract, even with an older mtime, gets a new name.
+        src = path.stat()
+        mirror = PROCESSED_DATA_DIR / f"{path.stem}.{src.st_mtime_ns}-{src.st_size}.parquet"
+        if _HAS_PARQUET and mirror.exists():
+            df = pd.read_parquet(mirror)
+            log.info("Loaded %s from %s (%d rows).", label, mirror, len(df))
+            return df
         df = pd.read_csv(path, low_memory=False)
         df.columns = [c.strip() for c in df.columns]
         log.info("Loaded %s from %s (%d rows).", label, path, len(df))
-        return df
     except Exception as exc:
         log.warning("Could not read %s (%s): %s", label, path, exc)
         return None
+    if _HAS_PARQUET:
+        try:
+            mirror.parent.mkdir(parents=True, exist_ok=True)
+            for stale in mirror.parent.glob(f"{path.stem}.*parquet"):   # older mirrors of this CSV
+                stale.unlink(missing_ok=True)
+            df.to_parquet(mirror, compression="zstd", index=False)
+        except Exception as exc:  # e.g. mixed-type object columns; CSV stays authoritative
+            log.debug("Could not write Parquet mirror %s: %s", mirror, exc)
+    return df
 
 
+@lru_cache(maxsize=1)
 def _load_yield_df() -> pd.DataFrame | None:
     """
     Load state_wise_yield.csv.
@@ -287,6 +308,7 @@ def _load_yield_df() -> pd.DataFrame | None:
     return out
 
 
+@lru_cache(maxsize=1)
 def _load_price_df() -> pd.DataFrame | None:
     """
     Load market_prices.csv.
@@ -336,6 +358,7 @@ def _load_price_df() -> pd.DataFrame | None:
     return out
 
 
+@lru_cache(maxsize=1)
 def _load_cost_df() -> pd.DataFrame | None:
     """
     Load cost_of_cultivation.csv.
@@ -379,6 +402,7 @@ def _load_cost_df() -> pd.DataFrame | None:
     return out
 
 
+@lru_cache(maxsize=1)
 def _load_climate_df() -> pd.DataFrame | None:
     """
     Load climate_vulnerability.csv.
@@ -426,12 +450,12 @@ def _load_climate_df() -> pd.DataFrame | None:
 
 
 # ---------------------------------------------------------------------------
-# Cached dataset loading (loaded once per process)
+# Cached dataset loading (each loader caches its own result, once per process,
+# so a price refresh can reload market_prices.csv alone)
 # ---------------------------------------------------------------------------
 
-@lru_cache(maxsize=1)
 def _datasets() -> dict:
-    """Load all four optional CSV datasets once; cache result."""
+    """The four optional CSV datasets, each from its loader's cache."""
     return {
         "yield":   _load_yield_df(),
         "price":   _load_price_df(),
@@ -21,6 +21,7 @@ from src.config import (
     SCALER_ARTIFACT_NAME,
     ENCODER_ARTIFACT_NAME,
     METADATA_FNAME,
+    FEATURE_COLUMNS,
     RANDOM_STATE,
     CV_FOLDS,
     ensure_dirs,
@@ -185,7 +186,8 @@ def train_and_select_best(
 def save_artifacts(model, scaler, label_encoder, metadata, feature_names):
     """Save model, scaler, label encoder, and metadata to models/."""
     ensure_dirs()
-    joblib.dump(model, MODELS_DIR / MODEL_ARTIFACT_NAME)
+    # Uncompressed so load_artifacts can memory-map it
+    joblib.dump(model, MODELS_DIR / MODEL_ARTIFACT_NAME, compress=0, protocol=5)
     joblib.dump(scaler, MODELS_DIR / SCALER_ARTIFACT_NAME)
     joblib.dump(label_encoder, MODELS_DIR / ENCODER_ARTIFACT_NAME)
     with open(MODELS_DIR / METADATA_FNAME, "w") as f:
@@ -5,24 +5,76 @@ Used by app and tests; no Streamlit dependency.
 """
 
 import hashlib
+from functools import lru_cache
 
-from src.config import (
-    FEATURE_COLUMNS,
-    ZONE_DEFAULTS,
-    STATE_ZONE,
-)
+import numpy as np
 
+from src.config import FEATURE_COLUMNS
 
-def _state_offset(state: str, district: str | None, feature: str) -> float:
-    """Deterministic offset per state+district so recommendations vary meaningfully by region.
+# The zone and district tables (src.config's lazy tables) are imported inside
+# the functions, so importing this module does not build them.
+
+_FALLBACK_SOIL_CLIMATE: dict[str, float] = {
+    "N": 50.0, "P": 50.0, "K": 50.0,
+    "temperature": 25.0, "humidity": 65.0, "ph": 6.5, "rainfall": 120.0,
+}
+
+# Per-feature offset scale and clip bounds, in FEATURE_COLUMNS order.
+_SPREAD = {
+    "N": (18, 0, 160), "P": (18, 0, 145), "K": (18, 0, 205),
+    "temperature": (4, 8.0, 42.0), "humidity": (6, 14.0, 99.0),
+    "ph": (0.6, 3.5, 9.5), "rainfall": (40, 20.0, 300.0),
+}
+_SCALE = np.array([_SPREAD[k][0] for k in FEATURE_COLUMNS], dtype=np.float64)
+_LO = np.array([_SPREAD[k][1] for k in FEATURE_COLUMNS], dtype=np.float64)
+_HI = np.array([_SPREAD[k][2] for k in FEATURE_COLUMNS], dtype=np.float64)
+_IS_NUTRIENT = np.array([k in ("N", "P", "K") for k in FEATURE_COLUMNS])
+
+
+def _seed(key: str) -> int:
+    """SHA-256 of key, reduced mod 100 (stable across restarts, unlike hash())."""
+    return int.from_bytes(hashlib.sha256(key.encode()).digest(), "big") % 100
+
+
+@lru_cache(maxsize=1024)
+def _region_offsets(state: str, district: str | None) -> np.ndarray:
+    """Deterministic per-feature offsets in [-1, 1] so recommendations vary by region.
 
     Uses hashlib (SHA-256) instead of hash() because Python's built-in hash()
     is randomized across process restarts (PYTHONHASHSEED), which would cause
     different recommendations for the same inputs on each app restart.
     """
-    key = f"{state}|{district or ''}|{feature}"
-    h = int(hashlib.sha256(key.encode()).hexdigest(), 16) % 100
-    return (h - 50) / 50.0  # -1.0 to +1.0
+    prefix = f"{state}|{district or ''}|"
+    seeds = np.fromiter(
+        (_seed(prefix + k) for k in FEATURE_COLUMNS), dtype=np.float64, count=len(FEATURE_COLUMNS)
+    )
+    offsets = (seeds - 50) / 50.0
+    offsets.flags.writeable = False   # cached and shared by every caller
+    return offsets
+
+
+def _soil_rows(state: str, districts: list[str | None]) -> list[tuple]:
+    """(len(districts), n_features) defaults for one state, computed as a single array."""
+    from src.config import ZONE_MATRIX, STATE_ZONE_ROW
+    deltas = np.stack([_region_offsets(state, d) for d in districts])
+    # N, P, K move in whole units (offset truncated toward zero, as int() does).
+    step = np.where(_IS_NUTRIENT, np.trunc(deltas * _SCALE), deltas * _SCALE)
+    table = np.clip(ZONE_MATRIX[STATE_ZONE_ROW[state]] + step, _LO, _HI)
+    return [
+        tuple(
+            int(v) if nutrient else round(float(v), 2)
+            for v, nutrient in zip(row, _IS_NUTRIENT)
+        )
+        for row in table
+    ]
+
+
+@lru_cache(maxsize=None)
+def _state_table(state: str) -> dict[str | None, tuple]:
+    """Defaults for the state itself (district None) and every listed district."""
+    from src.config import DISTRICTS_BY_STATE
+    districts = [None, *DISTRICTS_BY_STATE.get(state, [])]
+    return dict(zip(districts, _soil_rows(state, districts)))
 
 
 def get_default_soil_climate(state: str | None, district: str | None = None) -> dict[str, float]:
@@ -30,26 +82,10 @@ def get_default_soil_climate(state: str | None, district: str | None = None) ->
     State+district-specific soil/climate so ML recommendations vary by region.
     Returns N, P, K, temperature, humidity, ph, rainfall.
     """
+    from src.config import STATE_ZONE
     if not state or state not in STATE_ZONE:
-        return {
-            "N": 50.0, "P": 50.0, "K": 50.0,
-            "temperature": 25.0, "humidity": 65.0, "ph": 6.5, "rainfall": 120.0,
-        }
-    zone = STATE_ZONE[state]
-    base = ZONE_DEFAULTS[zone]
-    out = {}
-    for k in FEATURE_COLUMNS:
-        v = base[k]
-        delta = _state_offset(state, district, k)
-        if k == "temperature":
-            v = max(8.0, min(42.0, v + delta * 4))
-        elif k == "humidity":
-            v = max(14.0, min(99.0, v + delta * 6))
-        elif k == "ph":
-            v = max(3.5, min(9.5, v + delta * 0.6))
-        elif k == "rainfall":
-            v = max(20.0, min(300.0, v + delta * 40))
-        else:  # N, P, K
-            v = max(0, min(205 if k == "K" else 145 if k == "P" else 160, v + int(delta * 18)))
-        out[k] = round(v, 2) if isinstance(v, float) else v
-    return out
+        return dict(_FALLBACK_SOIL_CLIMATE)
+    row = _state_table(state).get(district or None)
+    if row is None:  # district not in DISTRICTS_BY_STATE
+        row = _soil_rows(state, [district])[0]
+    return dict(zip(FEATURE_COLUMNS, row))
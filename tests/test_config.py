@@ -0,0 +1,43 @@
+"""
+Consistency checks for the hand-maintained tables in src/config.py.
+Run from project root: python -m pytest tests/test_config.py -v
+"""
+
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import dataclasses
+
+import pytest
+
+from src import config
+from src.config import BIGHA_TO_ACRES, DISTRICTS_BY_STATE, INDIAN_STATES, SCORING
+
+
+def test_indian_states_match_bigha_table():
+    """INDIAN_STATES is a literal; it must list exactly the BIGHA_TO_ACRES states, sorted."""
+    assert INDIAN_STATES == tuple(sorted(BIGHA_TO_ACRES))
+
+
+def test_every_state_has_districts():
+    """data/static/districts_by_state.json covers every dropdown state with a non-empty list."""
+    assert set(DISTRICTS_BY_STATE) == set(INDIAN_STATES)
+    assert all(DISTRICTS_BY_STATE[s] for s in INDIAN_STATES)
+
+
+def test_scoring_cfg_mirrors_globals():
+    """SCORING is built from the module-level weights and cannot be changed at runtime."""
+    assert (SCORING.w_suitability, SCORING.w_profit, SCORING.w_risk) == (
+        config.W_SUITABILITY, config.W_PROFIT, config.W_RISK,
+    )
+    assert (SCORING.yield_base, SCORING.yield_conf) == (config.YIELD_BASE_FACTOR, config.YIELD_CONF_FACTOR)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        SCORING.w_profit = 1.0
+
+
+if __name__ == "__main__":
+    import subprocess
+    sys.exit(subprocess.call([sys.executable, "-m", "pytest", __file__, "-v", "-s"]))
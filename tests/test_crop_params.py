@@ -0,0 +1,83 @@
+"""
+Synthetic sampler: bounds, rounding, and batch output against per-crop output.
+Run from project root: python -m pytest tests/test_crop_params.py -v
+"""
+
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.stats import truncnorm
+
+from src.crop_params import (
+    CROP_NAMES,
+    CROP_PARAMS,
+    FEATURES,
+    generate_all_new_crops,
+    generate_crop_samples,
+    generate_samples_for_crops,
+    make_rng,
+)
+
+N = 200
+DECIMALS = {"N": 0, "P": 0, "K": 0, "temperature": 1, "humidity": 1, "ph": 2, "rainfall": 1}
+
+
+def _per_crop(crops, rngs):
+    return pd.concat(
+        [generate_crop_samples(c, N, rng=rng) for c, rng in zip(crops, rngs)], ignore_index=True
+    )
+
+
+def test_samples_stay_within_crop_bounds():
+    """Every feature of every crop lands inside its CROP_PARAMS [min, max]."""
+    df = generate_all_new_crops(N)
+    for crop, group in df.groupby("label", observed=True):
+        for f in FEATURES:
+            lo, hi, _, _ = CROP_PARAMS[crop][f]
+            assert group[f].between(lo, hi).all(), (crop, f)
+
+
+def test_samples_are_rounded_per_feature():
+    """NPK are whole numbers, ph has 2 decimals, the rest 1."""
+    df = generate_all_new_crops(N)
+    for f, decimals in DECIMALS.items():
+        np.testing.assert_array_equal(df[f].to_numpy(), df[f].round(decimals).to_numpy(), err_msg=f)
+
+
+def test_sampler_matches_scipy_truncnorm():
+    """The inverse-CDF draw equals scipy's truncnorm.ppf on the same uniforms, up to rounding."""
+    crop = CROP_NAMES[0]
+    df = generate_crop_samples(crop, N, rng=make_rng(7))
+    u = make_rng(7).random((len(FEATURES), N))
+    for j, f in enumerate(FEATURES):
+        lo, hi, mu, sigma = CROP_PARAMS[crop][f]
+        expected = truncnorm.ppf(u[j], (lo - mu) / sigma, (hi - mu) / sigma, loc=mu, scale=sigma)
+        np.testing.assert_allclose(df[f], expected, atol=0.5 * 10.0 ** -DECIMALS[f] + 1e-9, err_msg=f)
+
+
+def test_generate_all_new_crops_equals_per_crop_calls():
+    """The one-batch draw is the per-crop calls sharing one rng, concatenated in CROP_NAMES order."""
+    rng = make_rng()
+    expected = _per_crop(CROP_NAMES, [rng] * len(CROP_NAMES))
+    pd.testing.assert_frame_equal(generate_all_new_crops(N), expected)
+
+
+def test_generate_samples_for_crops_equals_per_crop_calls():
+    """Each crop's block equals generate_crop_samples on that crop's own rng."""
+    crops = ["wheat", *CROP_NAMES[:3]]
+    seeds = np.random.SeedSequence(11).spawn(len(crops))
+    expected = _per_crop(crops, [make_rng(s) for s in seeds])
+    got = generate_samples_for_crops(crops, N, [make_rng(s) for s in seeds])
+    pd.testing.assert_frame_equal(got, expected)
+
+
+def test_unknown_crop_raises():
+    """A crop without parameters is rejected before any sampling."""
+    with pytest.raises(ValueError):
+        generate_samples_for_crops(["not-a-crop"], N, [make_rng()])
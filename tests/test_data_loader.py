@@ -0,0 +1,98 @@
+"""
+crop_yield.csv conversion: the column-wise loader against the original per-row loop.
+Run from project root: python -m pytest tests/test_data_loader.py -v
+"""
+
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import hashlib
+
+import pandas as pd
+import pytest
+
+from src.config import (
+    CROP_YIELD_FNAME,
+    FEATURE_COLUMNS,
+    RAW_DATA_DIR,
+    STATE_ZONE,
+    TARGET_COLUMN,
+    ZONE_DEFAULTS,
+)
+from src.data_loader import CROP_YIELD_NAME_MAP, load_crop_yield_as_training
+
+CROP_YIELD_PATH = RAW_DATA_DIR / CROP_YIELD_FNAME
+BASE_PATH = RAW_DATA_DIR / "Crop_Recommendation.csv"
+
+pytestmark = pytest.mark.skipif(not CROP_YIELD_PATH.exists(), reason="crop_yield.csv not present")
+
+
+def _state_soil_climate(state):
+    if not state or state not in STATE_ZONE:
+        return {"N": 50.0, "P": 50.0, "K": 50.0, "temperature": 25.0, "humidity": 65.0, "ph": 6.5}
+    return dict(ZONE_DEFAULTS[STATE_ZONE[state]])
+
+
+def _reference_loop(base_df=None):
+    """The loader as it was before vectorisation: one iterrows pass, one dict per row."""
+    cy = pd.read_csv(CROP_YIELD_PATH)
+    cy = cy.set_axis([c.strip() for c in cy.columns], axis=1)
+    r_min = max(1, cy["Annual_Rainfall"].min()) if cy["Annual_Rainfall"].min() > 0 else 301.0
+    r_max = cy["Annual_Rainfall"].max() if cy["Annual_Rainfall"].max() > 0 else 6552.0
+
+    known_medians = {}
+    if base_df is not None and len(base_df) > 0:
+        known_medians = base_df.groupby(TARGET_COLUMN)[list(FEATURE_COLUMNS)].median().to_dict("index")
+
+    rows = []
+    for _, r in cy.iterrows():
+        key = str(r.get("Crop", "")).strip().lower()
+        label = CROP_YIELD_NAME_MAP.get(key, key)
+        if not label or label in ("oilseeds total", "other cereals", "other kharif pulses",
+                                  "other rabi pulses", "other summer pulses", "other oilseeds",
+                                  "other  rabi pulses"):
+            continue
+        ar = r.get("Annual_Rainfall")
+        if pd.isna(ar):
+            continue
+        if r_max <= r_min:
+            rain = 100.0
+        else:
+            rain = round(20 + (300 - 20) * (float(ar) - r_min) / (r_max - r_min), 2)
+        rain = max(20, min(300, rain))
+
+        state = str(r.get("State", "")).strip()
+        soil = known_medians[label] if label in known_medians else _state_soil_climate(state)
+        h = int(hashlib.sha256(f"{state}|{label}".encode()).hexdigest(), 16) % 100
+        delta = (h - 50) / 100.0
+        rows.append({
+            "N": round(soil["N"] + delta * 10, 1),
+            "P": round(soil["P"] + delta * 8, 1),
+            "K": round(soil["K"] + delta * 8, 1),
+            "temperature": round(soil["temperature"] + delta * 3, 2),
+            "humidity": round(soil["humidity"] + delta * 5, 2),
+            "ph": round(soil["ph"] + delta * 0.5, 2),
+            "rainfall": float(rain),
+            TARGET_COLUMN: label,
+        })
+    return pd.DataFrame(rows)
+
+
+def _assert_same(got, expected):
+    got = got.astype({TARGET_COLUMN: str})
+    pd.testing.assert_frame_equal(got, expected, check_exact=True)
+
+
+def test_state_defaults_match_reference_loop():
+    """Without base data every row takes its state's zone defaults plus the hash variation."""
+    _assert_same(load_crop_yield_as_training(), _reference_loop())
+
+
+@pytest.mark.skipif(not BASE_PATH.exists(), reason="Crop_Recommendation.csv not present")
+def test_known_crop_medians_match_reference_loop():
+    """Crops present in base_df take that crop's medians instead of the zone defaults."""
+    base_df = pd.read_csv(BASE_PATH)
+    _assert_same(load_crop_yield_as_training(base_df), _reference_loop(base_df))
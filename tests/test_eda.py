@@ -0,0 +1,81 @@
+"""
+Outlier report: the whole-matrix version against the original per-column loop.
+Run from project root: python -m pytest tests/test_eda.py -v
+"""
+
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.config import FEATURE_COLUMNS
+from src.eda import report_outliers
+
+
+def _reference_loop(df, method):
+    """report_outliers as it was before vectorisation: one dropna'd Series per feature."""
+    out = {}
+    for col in [c for c in FEATURE_COLUMNS if c in df.columns]:
+        x = df[col].dropna()
+        if method == "iqr":
+            q1, q3 = x.quantile(0.25), x.quantile(0.75)
+            iqr = q3 - q1
+            n_below = (x < q1 - 1.5 * iqr).sum()
+            n_above = (x > q3 + 1.5 * iqr).sum()
+        else:
+            z = np.abs((x - x.mean()) / (x.std() + 1e-8))
+            n_below = 0
+            n_above = (z > 3).sum()
+        out[col] = {"n_low": int(n_below), "n_high": int(n_above), "total": len(x)}
+    return out
+
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(3)
+    data = pd.DataFrame(rng.normal(50, 10, (500, len(FEATURE_COLUMNS))), columns=list(FEATURE_COLUMNS))
+    # Outliers on both sides, and missing values that must be left out of the stats
+    data.loc[:4, "N"] = 500.0
+    data.loc[5:9, "P"] = -200.0
+    data.loc[10:40, "ph"] = np.nan
+    data["label"] = "rice"
+    return data
+
+
+@pytest.mark.parametrize("method", ["iqr", "z"])
+def test_matches_reference_loop(df, method):
+    """Counts and totals equal the per-column loop, NaNs included."""
+    assert report_outliers(df, method) == _reference_loop(df, method)
+
+
+@pytest.mark.parametrize("method", ["iqr", "z"])
+def test_subset_of_features(df, method):
+    """Only the feature columns present are reported, in FEATURE_COLUMNS order."""
+    sub = df[["rainfall", "K", "label"]]
+    got = report_outliers(sub, method)
+    assert list(got) == ["K", "rainfall"]
+    assert got == _reference_loop(sub, method)
+
+
+def test_no_features():
+    """A frame without feature columns gives an empty report."""
+    assert report_outliers(pd.DataFrame({"label": ["rice"]})) == {}
+
+
+@pytest.mark.parametrize("method", ["iqr", "z"])
+def test_all_nan_column_is_quiet(df, method):
+    """An all-NaN or single-value column reports zero counts without numpy RuntimeWarnings."""
+    df["ph"] = np.nan
+    df.loc[1:, "K"] = np.nan
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        got = report_outliers(df, method)
+    assert got == _reference_loop(df, method)
+    assert got["ph"] == {"n_low": 0, "n_high": 0, "total": 0}
@@ -0,0 +1,107 @@
+"""
+Incremental market-price refresh: watermark boundary and dedup against the cached CSV.
+The data.gov.in API is replaced by an in-memory table; nothing is fetched over the network.
+Run from project root: python -m pytest tests/test_market_price_fetcher.py -v
+"""
+
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import pandas as pd
+import pytest
+
+from src import market_price_fetcher as mpf
+
+
+def _day(days_ago: int) -> str:
+    return (pd.Timestamp.today().normalize() - pd.Timedelta(days=days_ago)).strftime(mpf.ARRIVAL_DATE_FORMAT)
+
+
+def _row(state, district, commodity, arrival_date, price=2000.0):
+    return {
+        "state": state, "district": district, "market": district, "commodity": commodity,
+        "variety": "Other", "arrival_date": arrival_date,
+        "min_price": price - 100, "max_price": price + 100, "modal_price": price,
+    }
+
+
+class FakeAPI:
+    """Stands in for fetch_all_records; honours the state and arrival_date filters."""
+
+    def __init__(self):
+        self.rows = []
+        self.dates_requested = []
+
+    def __call__(self, api_key, state_filter=None, max_records=50_000, arrival_date=None):
+        self.dates_requested.append(arrival_date)
+        rows = [
+            r for r in self.rows
+            if (state_filter is None or r["state"] == state_filter)
+            and (arrival_date is None or r["arrival_date"] == arrival_date)
+        ]
+        return pd.DataFrame(rows, columns=mpf.KEEP_COLS)
+
+
+@pytest.fixture
+def api(monkeypatch):
+    fake = FakeAPI()
+    monkeypatch.setattr(mpf, "fetch_all_records", fake)
+    return fake
+
+
+@pytest.fixture
+def paths(tmp_path):
+    return {"output_path": tmp_path / "market_prices.csv", "watermark_path": tmp_path / "wm.json"}
+
+
+def test_row_published_later_for_watermark_day_is_appended(api, paths):
+    """The watermark day is re-fetched, so a late row for it is not lost."""
+    api.rows.append(_row("Punjab", "Patiala", "Wheat", _day(1)))
+    assert mpf.fetch_and_append("key", **paths) == 1
+
+    api.rows.append(_row("Punjab", "Patiala", "Maize", _day(1)))
+    assert mpf.fetch_and_append("key", **paths) == 1
+
+    cached = pd.read_csv(paths["output_path"])
+    assert sorted(cached["commodity"]) == ["Maize", "Wheat"]
+
+
+def test_overlapping_filters_do_not_duplicate_rows(api, paths):
+    """A state fetch and an all-states fetch keep separate watermarks but share the CSV."""
+    api.rows += [_row("Punjab", "Patiala", "Wheat", _day(2)), _row("Kerala", "Thrissur", "Rice", _day(2))]
+    assert mpf.fetch_and_append("key", **paths) == 2
+
+    api.rows.append(_row("Punjab", "Patiala", "Wheat", _day(1)))
+    assert mpf.fetch_and_append("key", state_filter="Punjab", **paths) == 1
+    assert mpf.fetch_and_append("key", **paths) == 0
+    assert mpf.fetch_and_append("key", state_filter="Punjab", **paths) == 0
+
+    cached = pd.read_csv(paths["output_path"])
+    assert len(cached) == 3
+    assert not cached.duplicated(subset=mpf.DEDUP_COLS).any()
+
+
+def test_top_up_queries_only_days_since_watermark(api, paths):
+    """After the first full fetch, only the watermark day through today is requested."""
+    api.rows.append(_row("Punjab", "Patiala", "Wheat", _day(2)))
+    mpf.fetch_and_append("key", **paths)
+    assert api.dates_requested == [None]
+
+    api.dates_requested.clear()
+    mpf.fetch_and_append("key", **paths)
+    assert api.dates_requested == [_day(2), _day(1), _day(0)]
+
+
+def test_dedup_scans_the_cache_in_chunks(api, paths, monkeypatch):
+    """Keys already cached are found whichever chunk of the CSV they sit in."""
+    monkeypatch.setattr(mpf, "_CACHE_CHUNK_ROWS", 1)
+    api.rows += [_row("Punjab", "Patiala", c, _day(1)) for c in ("Wheat", "Maize", "Rice")]
+    api.rows.append(_row("Punjab", "Patiala", "Wheat", _day(40)))
+    assert mpf.fetch_and_append("key", **paths) == 4
+
+    api.rows.append(_row("Punjab", "Patiala", "Barley", _day(1)))
+    assert mpf.fetch_and_append("key", **paths) == 1
+    assert len(pd.read_csv(paths["output_path"])) == 5